@@ -0,0 +1,78 @@
+# coding: utf-8
+"""
+Run every benchmark module and report all results.
+
+    python -m benchmarks [--json] [--quick] [--output FILE] [name ...]
+
+With names, only the modules containing any of them run, e.g. csv.
+The JSON report records the Python version and platform along with the
+results so that runs on different releases can be compared.
+"""
+import argparse
+import importlib
+import json
+import platform
+import sys
+
+from benchmarks import common
+
+
+MODULES = (
+    'bench_import',
+    'bench_lookup',
+    'bench_prefixed',
+    'bench_get_many',
+    'bench_cache',
+    'bench_csv',
+    'bench_choices',
+    'bench_cast',
+    'bench_parse',
+    'bench_startup',
+    'bench_secrets',
+    'bench_discovery',
+    'bench_schema',
+)
+
+
+def run(names=()):
+    for module_name in MODULES:
+        if names and not any(name in module_name for name in names):
+            continue
+        module = importlib.import_module('benchmarks.' + module_name)
+        for result in module.run():
+            result['module'] = module_name
+            yield result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('names', nargs='*', help='only run modules containing these names')
+    parser.add_argument('--json', action='store_true', help='emit JSON instead of a table')
+    parser.add_argument('--quick', action='store_true', help='fewer repetitions, for smoke runs')
+    parser.add_argument('--output', help='write the report to this file')
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        common.quick()
+
+    results = list(run(args.names))
+
+    stream = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        if args.json:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'results': results,
+            }, stream, indent=2, sort_keys=True)
+            stream.write('\n')
+        else:
+            common.report(results, stream)
+    finally:
+        if args.output:
+            stream.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# coding: utf-8
+"""
+Config cache hits, and the memory left by many distinct keys, unbounded
+and through an LRUCache.
+"""
+from decouple import Config, RepositoryEmpty, LRUCache
+from benchmarks.common import allocated, measure, main
+
+
+MAXSIZE = 1000
+DISTINCT = (10000, 100000)
+
+
+def make_caches():
+    return [
+        ('unbounded', lambda: True),
+        ('lru', lambda: LRUCache(MAXSIZE)),
+        ('lru ttl', lambda: LRUCache(MAXSIZE, ttl=300)),
+    ]
+
+
+def fill(cache, keys):
+    config = Config(RepositoryEmpty(), cache=cache)
+    for i in range(keys):
+        config('TENANT_{}_QUOTA'.format(i), default='10', cast=int)
+    return config
+
+
+def run():
+    for name, cache in make_caches():
+        config = Config(RepositoryEmpty(), cache=cache())
+        config('KEY', default='10', cast=int)
+        yield measure('hit {}'.format(name), lambda: config('KEY', default='10', cast=int))
+
+    for name, cache in make_caches():
+        for keys in DISTINCT:
+            yield allocated('{} keys={} memory'.format(name, keys), lambda: fill(cache(), keys))
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,24 @@
+# coding: utf-8
+"""
+Casting values already read, with the built in casts and nested helpers.
+"""
+from decouple import Config, RepositoryEmpty, Csv, Choices
+from benchmarks.common import measure, main
+
+
+def run():
+    config = Config(RepositoryEmpty())
+    cast = config._cast
+
+    yield measure('cast bool lower', lambda: cast('true', bool))
+    yield measure('cast bool title', lambda: cast('False', bool))
+    yield measure('cast bool from bool', lambda: cast(True, bool))
+    yield measure('cast int', lambda: cast('42', int))
+
+    nested = Csv(cast=Choices(['a', 'b', 'c']))
+    value = ', '.join(['a', 'b', 'c'] * 10)
+    yield measure('cast csv of choices 30 items', lambda: cast(value, nested))
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,26 @@
+# coding: utf-8
+"""
+Choices helper with few and many valid values.
+"""
+from decouple import Choices
+from benchmarks.common import measure, main
+
+
+SIZES = (10, 1000, 50000)
+
+
+def run():
+    for size in SIZES:
+        values = ['value{}'.format(i) for i in range(size)]
+        choices = Choices(values)
+        last = values[-1]
+        yield measure('choices n={} init'.format(size), lambda: Choices(values))
+        yield measure('choices n={} last value'.format(size), lambda: choices(last))
+
+        folded = Choices(values, normalize=lambda s: s.lower())
+        upper = last.upper()
+        yield measure('choices n={} normalized last value'.format(size), lambda: folded(upper))
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,27 @@
+# coding: utf-8
+"""
+Csv helper: plain values split with str.split, quoted values with shlex.
+"""
+from decouple import Csv
+from benchmarks.common import measure, main
+
+
+SIZES = (10, 1000, 100000)
+
+
+def hosts(size):
+    return ', '.join('host{}.example.com'.format(i) for i in range(size))
+
+
+def run():
+    csv = Csv()
+    for size in SIZES:
+        plain = hosts(size)
+        # A single quoted item is enough to need shlex for the whole value.
+        quoted = plain + ", 'quoted, item'"
+        yield measure('csv plain n={}'.format(size), lambda: csv(plain))
+        yield measure('csv quoted n={}'.format(size), lambda: csv(quoted))
+
+
+if __name__ == '__main__':
+    main(run)
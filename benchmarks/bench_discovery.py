@@ -0,0 +1,69 @@
+# coding: utf-8
+"""
+AutoConfig config file discovery from nested directories.
+"""
+import os
+import shutil
+import tempfile
+
+from mock import patch
+
+import decouple
+from decouple import AutoConfig
+from benchmarks.common import measure, main
+
+
+DEPTHS = (1, 5, 15)
+
+
+def make_tree(root, depth):
+    os.makedirs(root)
+    with open(os.path.join(root, '.env'), 'w') as f:
+        f.write('KEY=value\n')
+
+    path = root
+    for i in range(depth):
+        path = os.path.join(path, 'level{}'.format(i))
+        os.mkdir(path)
+    return path
+
+
+def discover(path):
+    AutoConfig.clear_discovery_cache()
+    return AutoConfig()._find_file(path)
+
+
+def count_calls(path):
+    """
+    Return the os.stat and os.scandir calls made by one cold discovery.
+    """
+    calls = {'stat': 0, 'scandir': 0}
+
+    def counting(name, func):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    AutoConfig.clear_discovery_cache()
+    with patch('os.stat', counting('stat', os.stat)):
+        with patch.object(decouple, 'scandir', counting('scandir', decouple.scandir)):
+            AutoConfig()._find_file(path)
+    return calls
+
+
+def run():
+    root = tempfile.mkdtemp()
+    try:
+        for depth in DEPTHS:
+            path = make_tree(os.path.join(root, str(depth)), depth)
+            result = measure('discovery depth={} cold'.format(depth), lambda: discover(path))
+            result.update(count_calls(path))
+            yield result
+            yield measure('discovery depth={} cached'.format(depth), lambda: AutoConfig()._find_file(path))
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,42 @@
+# coding: utf-8
+"""
+Config.get_many against the equivalent loop of Config.get calls.
+"""
+import os
+import shutil
+import tempfile
+
+from decouple import Config, RepositoryEnv, undefined
+from benchmarks.common import measure, main
+
+
+SIZES = (10, 100, 1000)
+
+
+def loop(config, spec):
+    return dict((option, config.get(option, default, cast)) for option, (default, cast) in spec.items())
+
+
+def run():
+    path = tempfile.mkdtemp()
+    try:
+        for size in SIZES:
+            envfile = os.path.join(path, '{}.env'.format(size))
+            spec = {}
+            with open(envfile, 'w') as f:
+                for i in range(size):
+                    # One in four is left to its default.
+                    if i % 4:
+                        f.write('KEY_{}={}\n'.format(i, i))
+                    spec['KEY_{}'.format(i)] = (undefined, undefined) if i % 2 else (0, int)
+            config = Config(RepositoryEnv(envfile))
+            assert loop(config, spec) == config.get_many(spec)
+
+            yield measure('get_many keys={}'.format(size), lambda: config.get_many(spec))
+            yield measure('get loop keys={}'.format(size), lambda: loop(config, spec))
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,46 @@
+# coding: utf-8
+"""
+Import time of decouple, as reported by python -X importtime.
+
+Each measure runs a fresh interpreter and takes the cumulative time of the
+decouple line, which includes every module it imports that wasn't already.
+"""
+import os
+import re
+import subprocess
+import sys
+
+from benchmarks import common
+from benchmarks.common import main
+
+
+LINE = re.compile(r'^import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*decouple$')
+
+
+def import_time():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    # Timing the compilation of decouple.py would hide everything else.
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    command = [sys.executable, '-X', 'importtime', '-c', 'import decouple']
+    best = None
+    for _ in range(common.REPEAT + 1):
+        child = subprocess.Popen(command, env=env, stderr=subprocess.PIPE, universal_newlines=True)
+        _, stderr = child.communicate()
+        if child.returncode:
+            raise RuntimeError(stderr)
+        for line in stderr.splitlines():
+            match = LINE.match(line.strip())
+            if match:
+                seconds = int(match.group(1)) / 1e6
+                best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def run():
+    yield {'name': 'import decouple', 'seconds': import_time(), 'number': 1}
+
+
+if __name__ == '__main__':
+    main(run)
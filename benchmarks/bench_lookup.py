@@ -0,0 +1,88 @@
+# coding: utf-8
+"""
+Config.get against each repository, and the bool cast.
+"""
+import os
+import shutil
+import tempfile
+
+from decouple import (Config, RepositoryEmpty, RepositoryEnv, RepositoryIni, RepositorySecret,
+                      RepositoryChain, strtobool)
+from benchmarks.common import measure, main
+
+
+KEYS = 100
+
+
+def make_repositories(path):
+    envfile = os.path.join(path, '.env')
+    with open(envfile, 'w') as f:
+        for i in range(KEYS):
+            f.write('KEY_{}=True\n'.format(i))
+
+    inifile = os.path.join(path, 'settings.ini')
+    with open(inifile, 'w') as f:
+        f.write('[settings]\nKEY_INI=True\n')
+        for i in range(KEYS):
+            f.write('KEY_{}=True\n'.format(i))
+
+    secrets = os.path.join(path, 'secrets')
+    os.mkdir(secrets)
+    for i in range(KEYS):
+        with open(os.path.join(secrets, 'KEY_{}'.format(i)), 'w') as f:
+            f.write('True')
+
+    return [
+        ('empty', RepositoryEmpty()),
+        ('env', RepositoryEnv(envfile)),
+        ('ini', RepositoryIni(inifile)),
+        ('secret', RepositorySecret(secrets)),
+    ]
+
+
+def enter_override(config):
+    with config.override(KEY_50='False'):
+        pass
+
+
+def set_environ():
+    os.environ['KEY_50'] = 'False'
+    del os.environ['KEY_50']
+
+
+def run():
+    path = tempfile.mkdtemp()
+    os.environ['BENCH_ENVIRON_KEY'] = 'True'
+    try:
+        repositories = make_repositories(path)
+        for name, repository in repositories:
+            config = Config(repository)
+            if name != 'empty':
+                yield measure('get {} repository'.format(name), lambda: config('KEY_50'))
+                yield measure('get {} repository cast=bool'.format(name), lambda: config('KEY_50', cast=bool))
+            yield measure('get {} environ'.format(name), lambda: config('BENCH_ENVIRON_KEY'))
+            yield measure('get {} default'.format(name), lambda: config('MISSING', default='x'))
+
+        # The key is only in the last repository of the chain.
+        env, ini = dict(repositories)['env'], dict(repositories)['ini']
+        empty = RepositoryEmpty()
+        chain = Config(RepositoryChain([empty, env, ini]))
+        yield measure('get chain of 3 last repository', lambda: chain('KEY_INI'))
+
+        # Override against patching os.environ, which calls putenv.
+        config = Config(env)
+        with config.override(KEY_50='False'):
+            yield measure('get env override', lambda: config('KEY_50'))
+            yield measure('get env not overridden', lambda: config('KEY_51'))
+        yield measure('enter and leave override', lambda: enter_override(config))
+        yield measure('set and delete os.environ', set_environ)
+
+        for value in ('True', 'off', 'yEs'):
+            yield measure('strtobool {!r}'.format(value), lambda: strtobool(value))
+    finally:
+        del os.environ['BENCH_ENVIRON_KEY']
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,58 @@
+# coding: utf-8
+"""
+Parsing .env and .ini files from 10 to 100k lines.
+"""
+import os
+import shutil
+import tempfile
+
+from decouple import RepositoryEnv, RepositoryIni
+from benchmarks.common import measure, main
+
+
+SIZES = (10, 1000, 100000)
+
+
+def write(filename, size, header=''):
+    with open(filename, 'w') as f:
+        f.write(header)
+        for i in range(size):
+            if i % 10 == 0:
+                f.write('# comment {}\n'.format(i))
+            else:
+                f.write('KEY_{} = "value {}"\n'.format(i, i))
+
+
+def write_references(filename, size):
+    # References nest about log2(size) deep, in both syntaxes.
+    with open(filename, 'w') as f:
+        f.write('KEY_1=value\n')
+        for i in range(2, size + 1):
+            if i % 2:
+                f.write('KEY_{}=${{KEY_{}}}/{}\n'.format(i, i // 2, i))
+            else:
+                f.write('KEY_{}=$KEY_{}/{}\n'.format(i, i // 2, i))
+
+
+def run():
+    path = tempfile.mkdtemp()
+    try:
+        for size in SIZES:
+            envfile = os.path.join(path, '{}.env'.format(size))
+            write(envfile, size)
+            yield measure('parse .env lines={}'.format(size), lambda: RepositoryEnv(envfile))
+
+            expanding = os.path.join(path, '{}.expanding.env'.format(size))
+            write_references(expanding, size)
+            yield measure('parse .env lines={} interpolate'.format(size),
+                          lambda: RepositoryEnv(expanding, interpolate=True))
+
+            inifile = os.path.join(path, '{}.ini'.format(size))
+            write(inifile, size, header='[settings]\n')
+            yield measure('parse .ini lines={}'.format(size), lambda: RepositoryIni(inifile))
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,45 @@
+# coding: utf-8
+"""
+Config.get_prefixed against a large .env, compared with scanning every key.
+"""
+import os
+import shutil
+import tempfile
+
+from decouple import Config, RepositoryEnv
+from benchmarks.common import measure, main
+
+
+SIZES = (100, 10000)
+# Settings per tenant, TENANT_<id>_<name>.
+SETTINGS = 10
+
+
+def scan(config, prefix):
+    repository = config.repository
+    names = set(name for name in os.environ if name.startswith(prefix))
+    names.update(name for name in repository.keys() if name.startswith(prefix))
+    return dict((name[len(prefix):], config(name)) for name in names)
+
+
+def run():
+    path = tempfile.mkdtemp()
+    try:
+        for size in SIZES:
+            envfile = os.path.join(path, '{}.env'.format(size))
+            with open(envfile, 'w') as f:
+                for i in range(size // SETTINGS):
+                    for j in range(SETTINGS):
+                        f.write('TENANT_{}_SETTING_{}=value\n'.format(i, j))
+            config = Config(RepositoryEnv(envfile))
+            prefix = 'TENANT_{}_'.format(size // SETTINGS // 2)
+            assert scan(config, prefix) == config.get_prefixed(prefix)
+
+            yield measure('get_prefixed keys={}'.format(size), lambda: config.get_prefixed(prefix))
+            yield measure('scan keys={}'.format(size), lambda: scan(config, prefix))
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
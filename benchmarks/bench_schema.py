@@ -0,0 +1,54 @@
+# coding: utf-8
+"""
+Resolving a 300 settings Schema against the same config() calls one by one.
+"""
+import os
+import shutil
+import tempfile
+
+from decouple import Config, RepositoryEnv, Schema, Setting, Csv
+from benchmarks.common import measure, main
+
+
+KEYS = 300
+
+
+def make_env(path):
+    with open(path, 'w') as f:
+        for i in range(KEYS):
+            f.write('KEY_{}=host{}.example.com, other.example.com\n'.format(i, i))
+
+
+def make_schema():
+    settings = {}
+    for i in range(KEYS):
+        if i % 3 == 0:
+            settings['KEY_{}'.format(i)] = Setting(cast=Csv())
+        elif i % 3 == 1:
+            settings['KEY_{}'.format(i)] = Setting()
+        else:
+            settings['MISSING_{}'.format(i)] = Setting(default='42', cast=int)
+    return Schema(settings)
+
+
+def one_by_one(config, schema):
+    return dict((name, config.get(name, setting.default, setting.cast))
+                for name, setting in schema.settings.items())
+
+
+def run():
+    path = tempfile.mkdtemp()
+    try:
+        envfile = os.path.join(path, '.env')
+        make_env(envfile)
+        config = Config(RepositoryEnv(envfile))
+        schema = make_schema()
+
+        yield measure('schema {} keys config() calls'.format(KEYS), lambda: one_by_one(config, schema))
+        yield measure('schema {} keys resolve'.format(KEYS), lambda: schema.resolve(config))
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
@@ -0,0 +1,58 @@
+# coding: utf-8
+"""
+RepositorySecret startup with 200 mounted secrets, a few of them large,
+lookups and reloads when watching them for rotation.
+"""
+import os
+import shutil
+import tempfile
+
+from decouple import RepositorySecret
+from benchmarks.common import allocated, measure, main
+
+
+SECRETS = 200
+LARGE = 5
+LARGE_SIZE = 2 * 1024 * 1024
+
+
+def make_secrets(path):
+    for i in range(SECRETS):
+        size = LARGE_SIZE if i < LARGE else 64
+        with open(os.path.join(path, 'secret_{}'.format(i)), 'w') as f:
+            f.write('x' * size)
+
+
+def run():
+    path = tempfile.mkdtemp()
+    try:
+        make_secrets(path)
+        for lazy in (False, True):
+            name = 'secrets {} lazy={}'.format(SECRETS, lazy)
+            yield measure(name + ' init', lambda: RepositorySecret(path, lazy=lazy))
+            yield allocated(name + ' memory', lambda: RepositorySecret(path, lazy=lazy))
+
+        repo = RepositorySecret(path, lazy=True)
+        key = 'secret_{}'.format(SECRETS - 1)
+        repo[key]
+        yield measure('secrets lazy cached lookup', lambda: repo[key])
+
+        watched = RepositorySecret(path, reload_interval=60)
+        yield measure('secrets watched lookup', lambda: watched[key])
+
+        # Rotate one small secret and reload: only that file is read again.
+        rotated = os.path.join(path, 'secret_{}'.format(SECRETS - 1))
+
+        def rotate_and_reload():
+            with open(rotated + '.new', 'w') as f:
+                f.write('y' * 64)
+            os.rename(rotated + '.new', rotated)
+            watched.reload()
+
+        yield measure('secrets reload after rotating 1', rotate_and_reload)
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
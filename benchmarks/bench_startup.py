@@ -0,0 +1,72 @@
+# coding: utf-8
+"""
+Startup of 1, 8 and 64 concurrent processes each reading a large .env or
+settings.ini, parsing it or loading it from the on-disk cache.
+
+Times are the wall time until the last process exits, Python startup
+included, so compare the cached and parsed rows of the same size.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import common
+from benchmarks.common import main
+from benchmarks.bench_parse import write
+
+
+PROCESSES = (1, 8, 64)
+LINES = 20000
+
+SCRIPT = '''
+import sys
+from decouple import {cls}
+cache_dir = sys.argv[2] or None
+{cls}(sys.argv[1], cache_dir=cache_dir)['KEY_1']
+'''
+
+
+def start(processes, cls, filename, cache_dir):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    script = SCRIPT.format(cls=cls)
+
+    best = None
+    for _ in range(common.REPEAT):
+        began = time.time()
+        children = [subprocess.Popen([sys.executable, '-c', script, filename, cache_dir], env=env)
+                    for _ in range(processes)]
+        for child in children:
+            if child.wait():
+                raise RuntimeError('benchmark process failed')
+        elapsed = time.time() - began
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run():
+    path = tempfile.mkdtemp()
+    try:
+        envfile = os.path.join(path, '.env')
+        write(envfile, LINES)
+        inifile = os.path.join(path, 'settings.ini')
+        write(inifile, LINES, header='[settings]\n')
+        cache_dir = os.path.join(path, 'cache')
+
+        for cls, filename in (('RepositoryEnv', envfile), ('RepositoryIni', inifile)):
+            # Fill the cache once, like the first worker would.
+            start(1, cls, filename, cache_dir)
+            for processes in PROCESSES:
+                for label, directory in (('parsed', ''), ('cached', cache_dir)):
+                    name = 'startup {} lines={} processes={} {}'.format(cls, LINES, processes, label)
+                    seconds = start(processes, cls, filename, directory)
+                    yield {'name': name, 'seconds': seconds, 'number': 1}
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main(run)
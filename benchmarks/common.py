@@ -0,0 +1,82 @@
+# coding: utf-8
+"""
+Tiny helpers shared by the benchmark modules.
+
+Each module exposes a ``run()`` generator yielding the dicts built by
+``measure`` and ends with ``main(run)`` so it can be run on its own:
+
+    python -m benchmarks.bench_csv [--json] [--quick]
+
+``python -m benchmarks`` runs all of them.
+"""
+import json
+import sys
+import timeit
+
+
+# Lowered by --quick.
+REPEAT = 5
+MIN_TIME = 0.2
+
+
+def measure(name, func, repeat=None, min_time=None):
+    """
+    Return the best time per call of func, in seconds.
+    """
+    repeat = repeat or REPEAT
+    min_time = min_time or MIN_TIME
+    timer = timeit.Timer(func)
+
+    # Grow the number of calls until one batch takes at least min_time.
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 10 ** 7:
+            break
+        number *= 10
+
+    best = min([elapsed] + timer.repeat(repeat=repeat - 1, number=number))
+    return {'name': name, 'seconds': best / number, 'number': number}
+
+
+def allocated(name, func):
+    """
+    Return the memory still allocated by func's result, in bytes.
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        result = func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {'name': name, 'bytes': size}
+
+
+def report(results, stream=None, as_json=False):
+    stream = stream or sys.stdout
+    if as_json:
+        json.dump(results, stream, indent=2, sort_keys=True)
+        stream.write('\n')
+        return
+
+    for result in results:
+        if 'bytes' in result:
+            stream.write('{:<60} {:>14.1f} KiB\n'.format(result['name'], result['bytes'] / 1024.0))
+        else:
+            stream.write('{:<60} {:>14.3f} us\n'.format(result['name'], result['seconds'] * 1e6))
+
+
+def quick():
+    global REPEAT, MIN_TIME
+    REPEAT = 1
+    MIN_TIME = 0.01
+
+
+def main(run, argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if '--quick' in argv:
+        quick()
+    report(list(run()), as_json='--json' in argv)
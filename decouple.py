@@ -1,21 +1,31 @@
 # coding: utf-8
 import os
 import sys
-import string
-from shlex import shlex
+import time
+import marshal
 from io import open
-from collections import OrderedDict
+
+# Read by setup.py, and part of the key of cached parsed files.
+__version__ = '3.8'
 
 # Useful for very coarse version differentiation.
 PYVERSION = sys.version_info
 
 
 if PYVERSION >= (3, 0, 0):
-    from configparser import ConfigParser, NoOptionError
+    from _thread import allocate_lock
     text_type = str
+    string_types = (str,)
 else:
-    from ConfigParser import SafeConfigParser as ConfigParser, NoOptionError
+    from thread import allocate_lock
     text_type = unicode
+    string_types = (str, unicode)
+
+if PYVERSION >= (3, 7, 0):
+    # Plain dicts keep insertion order, no need to import collections.
+    ordered_dict = dict
+else:
+    from collections import OrderedDict as ordered_dict
 
 if PYVERSION >= (3, 2, 0):
     read_config = lambda parser, file: parser.read_file(file)
@@ -25,6 +35,59 @@ else:
 
 DEFAULT_ENCODING = 'UTF-8'
 
+# Python 2 has no monotonic clock.
+monotonic = getattr(time, 'monotonic', time.time)
+perf_counter = getattr(time, 'perf_counter', time.time)
+
+# Python 2 has no scandir.
+scandir = getattr(os, 'scandir', None)
+
+# Python 2 has no atomic replace, rename only overwrites on POSIX.
+replace = getattr(os, 'replace', os.rename)
+
+# The same as string.whitespace, without importing string (and re).
+WHITESPACE = ' \t\n\r\x0b\x0c'
+
+
+# configparser, shlex and friends are only imported when first needed, so
+# that importing decouple stays cheap. These names used to be imported
+# eagerly and remain available as attributes of the module.
+def _configparser():
+    if PYVERSION >= (3, 0, 0):
+        from configparser import ConfigParser, InterpolationError, NoOptionError
+    else:
+        from ConfigParser import SafeConfigParser as ConfigParser, InterpolationError, NoOptionError
+    return ConfigParser, InterpolationError, NoOptionError
+
+
+def __getattr__(name):
+    if name == 'ConfigParser':
+        value = _configparser()[0]
+    elif name == 'InterpolationError':
+        value = _configparser()[1]
+    elif name == 'NoOptionError':
+        value = _configparser()[2]
+    elif name == 'shlex':
+        from shlex import shlex as value
+    elif name == 'string':
+        import string as value
+    elif name == 'partial':
+        from functools import partial as value
+    elif name == 'OrderedDict':
+        from collections import OrderedDict as value
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+if PYVERSION < (3, 7, 0):
+    # No module __getattr__ before Python 3.7.
+    for _name in ('ConfigParser', 'InterpolationError', 'NoOptionError', 'shlex', 'string',
+                  'partial', 'OrderedDict'):
+        __getattr__(_name)
+    del _name
+
 
 # Python 3.10 don't have strtobool anymore. So we move it here.
 TRUE_VALUES = {"y", "yes", "t", "true", "on", "1"}
@@ -43,10 +106,100 @@ def strtobool(value):
     raise ValueError("Invalid truth value: " + value)
 
 
+def _boolean_table():
+    table = {'': False}
+    for values, result in ((TRUE_VALUES, True), (FALSE_VALUES, False)):
+        for value in values:
+            for variant in (value, value.upper(), value.title()):
+                table[variant] = result
+    return table
+
+
+# Usual spellings of booleans, so most casts are a single dict lookup.
+BOOLEANS = _boolean_table()
+
+
+def _cast_boolean(value):
+    """
+    Helper to convert config values to boolean as ConfigParser do.
+    """
+    if value is True or value is False:
+        return value
+    try:
+        return BOOLEANS[value]
+    except (KeyError, TypeError):
+        value = str(value)
+        return bool(value) if value == '' else bool(strtobool(value))
+
+
+# Converters Config.get calls instead of the given cast, see register_cast.
+CASTS = {bool: _cast_boolean}
+
+
+def register_cast(cast, converter):
+    """
+    Make Config.get call converter(value) whenever it is given cast.
+
+    Only the cast given to Config.get is replaced, not casts nested in
+    helpers, just like bool in Csv(cast=bool) is the plain bool.
+    """
+    CASTS[cast] = converter
+
+
+def compile_cast(cast):
+    """
+    Return the callable Config.get uses for cast.
+    """
+    if isinstance(cast, (Csv, Choices)):
+        return cast.compile()
+
+    try:
+        return CASTS.get(cast, cast)
+    except TypeError:
+        # Unhashable cast, it can't be registered.
+        return cast
+
+
+def _compile_nested(cast):
+    if isinstance(cast, (Csv, Choices)):
+        return cast.compile()
+    return cast
+
+
 class UndefinedValueError(Exception):
     pass
 
 
+class ExpansionError(Exception):
+    """
+    A ${VAR} or $VAR reference in a .env value could not be expanded.
+    """
+    pass
+
+
+class ParseError(Exception):
+    """
+    A malformed line in a .env file, only raised in strict mode.
+    """
+    def __init__(self, source, lineno, message):
+        self.source = source
+        self.lineno = lineno
+        super(ParseError, self).__init__('{}, line {}: {}'.format(source, lineno, message))
+
+
+class ConfigurationError(Exception):
+    """
+    Several options could not be resolved.
+
+    errors maps each failing name to the exception it raised.
+    """
+    def __init__(self, errors):
+        self.errors = errors
+        lines = ['{}: {}'.format(name, errors[name]) for name in sorted(errors)]
+        super(ConfigurationError, self).__init__(
+            '{} setting(s) could not be resolved:\n  {}'.format(len(errors), '\n  '.join(lines)))
+
+
 class Undefined(object):
     """
     Class to represent undefined type.
@@ -58,29 +211,363 @@ class Undefined(object):
 undefined = Undefined()
 
 
+def _environ_subset(environ, names):
+    """
+    Return a plain dict holding at least the variables of environ in names.
+    """
+    # Each lookup in os.environ encodes the name, copy what is cheaper to copy.
+    if len(names) > len(environ):
+        return dict(environ)
+    return dict((name, environ[name]) for name in names if name in environ)
+
+
+def _optionxforms(repository):
+    """
+    Return the functions repository normalizes option names with.
+    """
+    if isinstance(repository, RepositoryChain):
+        return [optionxform for _, _, optionxform, _ in repository.folding]
+    optionxform = getattr(repository, 'optionxform', None)
+    return [optionxform] if optionxform is not None else []
+
+
+def _distinct_options(names, repository_names, optionxform):
+    """
+    Return names with the repository_names that are not the same option as
+    any of them, like db_host in an ini file for the variable DB_HOST.
+    """
+    names = set(names)
+    if optionxform is None:
+        return names | set(repository_names)
+    hidden = set(optionxform(name) for name in names)
+    names.update(name for name in repository_names if optionxform(name) not in hidden)
+    return names
+
+
+def _prefixed(keys, prefix, optionxforms=()):
+    """
+    Return the items of the sorted keys starting with prefix, or with the
+    prefix as any of optionxforms normalizes it.
+    """
+    from bisect import bisect_left
+
+    prefixes = [prefix]
+    for optionxform in optionxforms:
+        if optionxform(prefix) not in prefixes:
+            prefixes.append(optionxform(prefix))
+
+    found = []
+    for prefix in prefixes:
+        end = start = bisect_left(keys, prefix)
+        while end < len(keys) and keys[end].startswith(prefix):
+            end += 1
+        found.extend(keys[start:end])
+    return found
+
+
+class LRUCache(object):
+    """
+    Cache of casted values holding at most maxsize of them, dropping the
+    least recently used first.
+
+    Pass it as the cache of a Config:
+
+        config = Config(RepositoryEnv('.env'), cache=LRUCache(10000, ttl=300))
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Most values kept.
+    ttl : float, optional
+        Seconds each value is kept after it was cached, forever if None.
+
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        from collections import OrderedDict
+
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1, got {!r}'.format(maxsize))
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self.expirations = 0
+        # Least recently used first. With a ttl values are (value, deadline).
+        self._data = OrderedDict()
+        # Python 2 OrderedDict can only move a key by reinserting it.
+        self._move_to_end = getattr(self._data, 'move_to_end', self._reinsert)
+
+    def _reinsert(self, key):
+        self._data[key] = self._data.pop(key)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if self.ttl is not None:
+            value, deadline = value
+            if monotonic() >= deadline:
+                self.expirations += 1
+                self._data.pop(key, None)
+                raise KeyError(key)
+        try:
+            self._move_to_end(key)
+        except KeyError:
+            # Evicted by another thread meanwhile, the value is still good.
+            pass
+        return value
+
+    def __setitem__(self, key, value):
+        data = self._data
+        if self.ttl is not None:
+            value = (value, monotonic() + self.ttl)
+        data[key] = value
+        try:
+            self._move_to_end(key)
+        except KeyError:
+            # Evicted by another thread meanwhile, it will be cached again.
+            pass
+        while len(data) > self.maxsize:
+            try:
+                data.popitem(last=False)
+            except KeyError:
+                break
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+
+    def info(self):
+        """
+        Return the bound and how many values were dropped, as a dict.
+        """
+        return {
+            'maxsize': self.maxsize,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+
+class _ThreadLocalVar(object):
+    """
+    Stand-in for contextvars.ContextVar before Python 3.7, holding one
+    value per thread.
+    """
+
+    def __init__(self):
+        from threading import local
+
+        self._local = local()
+
+    def get(self):
+        return getattr(self._local, 'value', None)
+
+    def set(self, value):
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+# Guards the creation of the variables holding overrides.
+_overrides_lock = allocate_lock()
+
+
+def _overrides_var(owner):
+    """
+    Return the variable holding owner's overrides, creating it if needed.
+    """
+    # Created on first use, so that importing decouple doesn't import
+    # contextvars.
+    with _overrides_lock:
+        if owner._overrides is None:
+            if PYVERSION >= (3, 7, 0):
+                from contextvars import ContextVar
+                owner._overrides = ContextVar('decouple.overrides', default=None)
+            else:
+                owner._overrides = _ThreadLocalVar()
+    return owner._overrides
+
+
+class _Override(object):
+    """
+    Context manager laying values over the lookups of a Config in the
+    current thread or asyncio task, see Config.override.
+    """
+
+    def __init__(self, var, values):
+        self.var = var
+        self.values = values
+        self._tokens = []
+
+    def __enter__(self):
+        # Copied so that leaving a nested override restores the outer one.
+        overlay = dict(self.var.get() or ())
+        overlay.update(self.values)
+        self._tokens.append(self.var.set(overlay))
+        return self
+
+    def __exit__(self, *exc_info):
+        self.var.reset(self._tokens.pop())
+
+
 class Config(object):
     """
     Handle .env file format used by Foreman.
+
+    Parameters
+    ----------
+    repository : Repository
+        Where options are read from when they are not set in the environment.
+    cache : bool or LRUCache, optional
+        Memoize the casted value of each (option, cast, default) lookup,
+        without bound if True. Cached values are dropped on
+        ``invalidate()`` and whenever the repository is reloaded.
+
     """
 
-    def __init__(self, repository):
+    def __init__(self, repository, cache=False):
         self.repository = repository
+        if isinstance(cache, LRUCache):
+            self._cache = cache
+        else:
+            self._cache = {} if cache else None
+        self._cache_version = getattr(repository, 'version', 0)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Callables notified of every lookup, see add_hook.
+        self.hooks = []
+        # Sorted repository keys and the repository version they are for.
+        self._index = None
+        self._index_version = None
+        # Holds the values set with override, per thread or asyncio task.
+        self._overrides = None
+        # Subclasses may still change how bools are cast by overriding
+        # _cast_boolean, which then wins over the CASTS registry.
+        self._bool_override = type(self)._cast_boolean != Config._cast_boolean
 
     def _cast_boolean(self, value):
         """
         Helper to convert config values to boolean as ConfigParser do.
         """
-        value = str(value)
-        return bool(value) if value == '' else bool(strtobool(value))
+        return _cast_boolean(value)
 
     @staticmethod
     def _cast_do_nothing(value):
         return value
 
+    def override(self, **values):
+        """
+        Return a context manager reading options from values instead.
+
+        Values are cast like those from the environment and take precedence
+        over it and the cache. They are only seen by the current thread or
+        asyncio task, os.environ is left untouched, and nested overrides
+        restore the outer values on exit.
+
+            with config.override(DEBUG='True'):
+                assert config('DEBUG', cast=bool)
+        """
+        return _Override(_overrides_var(self), values)
+
+    def invalidate(self):
+        """
+        Drop all cached values.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def cache_info(self):
+        """
+        Return the cache statistics as a dict.
+        """
+        info = {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self._cache) if self._cache is not None else 0,
+        }
+        if isinstance(self._cache, LRUCache):
+            info.update(self._cache.info())
+        return info
+
+    def add_hook(self, hook):
+        """
+        Call hook(option, source, cast_time) after every lookup.
+
+        source is where the value came from: 'override', 'environ',
+        'repository', 'default' or 'cache'. cast_time is in seconds.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def record(self):
+        """
+        Start recording lookups and return the Recorder.
+        """
+        recorder = Recorder()
+        self.add_hook(recorder)
+        return recorder
+
     def get(self, option, default=undefined, cast=undefined):
         """
         Return the value for option or default if defined.
         """
+        overlay = self._overrides and self._overrides.get()
+        if overlay and option in overlay:
+            return self._get_override(option, overlay[option], cast)
+        if self._cache is not None:
+            return self._get_cached(option, default, cast)
+        return self._get(option, default, cast)
+
+    def _get_override(self, option, value, cast):
+        if not self.hooks:
+            return self._cast(value, cast)
+
+        start = perf_counter()
+        value = self._cast(value, cast)
+        self._notify(option, 'override', perf_counter() - start)
+        return value
+
+    def _get_cached(self, option, default, cast):
+        # Cache hits never reach the repository, so give it a chance to
+        # notice its source changed.
+        if getattr(self.repository, 'reload_interval', None) is not None:
+            self.repository.refresh()
+
+        version = getattr(self.repository, 'version', 0)
+        if version != self._cache_version:
+            self._cache.clear()
+            self._cache_version = version
+
+        # The type is part of the key so that default=1 and default=True
+        # don't share an entry. The version too, so that a value read before
+        # a concurrent reload, and stored after it, is never served.
+        key = (option, cast, default, type(default), version)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable default or cast, nothing we can memoize.
+            return self._get(option, default, cast)
+        else:
+            self.cache_hits += 1
+            if self.hooks:
+                self._notify(option, 'cache', 0.0)
+            return value
+
+        self.cache_misses += 1
+        value = self._cache[key] = self._get(option, default, cast)
+        return value
+
+    def _get(self, option, default, cast):
+        if self.hooks:
+            return self._get_instrumented(option, default, cast)
 
         # We can't avoid __contains__ because value may be empty.
         if option in os.environ:
@@ -88,17 +575,153 @@ class Config(object):
         elif option in self.repository:
             value = self.repository[option]
         else:
-            if isinstance(default, Undefined):
-                raise UndefinedValueError('{} not found. Declare it as envvar or define a default value.'.format(option))
+            value = self._default(option, default)
+
+        return self._cast(value, cast)
 
-            value = default
+    def _lookup(self, option, default):
+        """
+        Return where the value of option comes from and the value.
+        """
+        if option in os.environ:
+            return 'environ', os.environ[option]
+        elif option in self.repository:
+            return 'repository', self.repository[option]
+        return 'default', self._default(option, default)
 
+    def _get_instrumented(self, option, default, cast):
+        source, value = self._lookup(option, default)
+
+        start = perf_counter()
+        value = self._cast(value, cast)
+        self._notify(option, source, perf_counter() - start)
+
+        return value
+
+    def _notify(self, option, source, cast_time):
+        for hook in self.hooks:
+            hook(option, source, cast_time)
+
+    @staticmethod
+    def _default(option, default):
+        if isinstance(default, Undefined):
+            raise UndefinedValueError('{} not found. Declare it as envvar or define a default value.'.format(option))
+
+        return default
+
+    def _cast(self, value, cast):
         if isinstance(cast, Undefined):
-            cast = self._cast_do_nothing
-        elif cast is bool:
-            cast = self._cast_boolean
+            return value
+        if cast is bool and self._bool_override:
+            return self._cast_boolean(value)
+
+        return compile_cast(cast)(value)
+
+    def get_many(self, spec):
+        """
+        Return a dict of the values of several options at once.
+
+        spec maps each option to a (default, cast) tuple, with undefined
+        as the default of required options. Instead of stopping at the
+        first problem, raises a ConfigurationError listing every option
+        that is missing or fails its cast.
+        """
+        get = self._batch_get(spec)
+        values = {}
+        errors = {}
+        for option, (default, cast) in spec.items():
+            try:
+                values[option] = get(option, default, cast)
+            except Exception as e:
+                errors[option] = e
+
+        if errors:
+            raise ConfigurationError(errors)
+        return values
+
+    def _batch_get(self, options):
+        """
+        Return a function working as get for the given options only.
+        """
+        # Hooks, the cache and overrides want every lookup to go through get.
+        if self.hooks or self._cache is not None or (self._overrides and self._overrides.get()):
+            return self.get
+
+        environ = _environ_subset(os.environ, options)
+        repository = self.repository
+        # Options found in environ never reach the repository, which can
+        # then skip looking there again.
+        fetch = getattr(repository, '_fetch', None)
+        if fetch is None:
+            fetch = lambda option: repository[option] if option in repository else undefined
+        lookup_default = self._default
+        cast_value = self._cast
+
+        def get(option, default, cast):
+            value = environ.get(option, undefined)
+            if value is undefined:
+                value = fetch(option)
+                if value is undefined:
+                    value = lookup_default(option, default)
+            return cast_value(value, cast)
+
+        return get
+
+    def get_prefixed(self, prefix, cast=undefined, strip_prefix=True):
+        """
+        Return a dict of the values of every option starting with prefix.
+
+        Options are collected from the environment and the repository, and
+        each is read like get would, environment first. The keys of the dict
+        are the option names, without the prefix if strip_prefix.
+        """
+        names, repository_names = self._prefixed_options(prefix)
+        overlay = self._overrides and self._overrides.get()
+        if overlay:
+            names.update(name for name in overlay if name.startswith(prefix))
+        # Names from the environment or overrides hide the same option in
+        # the repository, as they do in get.
+        options = _distinct_options(
+            names, repository_names, getattr(self.repository, 'optionxform', None))
+
+        values = {}
+        for option in options:
+            key = option[len(prefix):] if strip_prefix else option
+            values[key] = self.get(option, cast=cast)
+        return values
+
+    def _prefixed_options(self, prefix):
+        """
+        Return the set of names starting with prefix in the environment,
+        and the list of those in the repository.
+        """
+        repository = self.repository
+        if getattr(repository, 'reload_interval', None) is not None:
+            repository.refresh()
+
+        # The repository only changes on reload, so its keys are sorted once
+        # per version and each query is a bisect.
+        version = getattr(repository, 'version', 0)
+        if self._index is None or self._index_version != version:
+            self._index = sorted(repository.keys())
+            self._index_version = version
+
+        repository_names = _prefixed(self._index, prefix, _optionxforms(repository))
+        # os.environ can change at any time, so it is scanned every time.
+        names = set(name for name in os.environ if name.startswith(prefix))
+        return names, repository_names
+
+    def freeze(self):
+        """
+        Return a FrozenConfig with a snapshot of the environment and repository.
 
-        return cast(value)
+        The hooks registered so far keep being called on its lookups, and
+        overrides of this config apply to it too.
+        """
+        frozen = FrozenConfig(self.repository)
+        frozen.hooks = list(self.hooks)
+        frozen._overrides = _overrides_var(self)
+        return frozen
 
     def __call__(self, *args, **kwargs):
         """
@@ -107,8 +730,150 @@ class Config(object):
         return self.get(*args, **kwargs)
 
 
+class Recorder(object):
+    """
+    Lookup hook counting, per option, the lookups, where their values came
+    from and the time spent casting them.
+    """
+
+    def __init__(self):
+        self.stats = {}
+
+    def __call__(self, option, source, cast_time):
+        stats = self.stats.get(option)
+        if stats is None:
+            stats = self.stats[option] = {'count': 0, 'sources': {}, 'cast_time': 0.0}
+
+        stats['count'] += 1
+        stats['sources'][source] = stats['sources'].get(source, 0) + 1
+        stats['cast_time'] += cast_time
+
+    def as_dict(self):
+        """
+        Return a copy of the statistics.
+        """
+        return dict(
+            (option, dict(stats, sources=dict(stats['sources'])))
+            for option, stats in self.stats.items()
+        )
+
+    def clear(self):
+        self.stats = {}
+
+
+class FrozenConfig(Config):
+    """
+    Config reading from a snapshot of os.environ and the repository.
+
+    Each lookup is a plain dict probe. Changes to os.environ or to the
+    repository after the snapshot is taken are not seen, use drift() to
+    find out if the environment moved on.
+
+    Parameters
+    ----------
+    repository : Repository
+        Repository to snapshot. It must list its options with ``keys()``.
+
+    """
+
+    def __init__(self, repository):
+        super(FrozenConfig, self).__init__(repository)
+
+        keys = getattr(repository, 'keys', None)
+        if keys is None:
+            raise TypeError('Cannot freeze {!r}, it does not list its keys.'.format(repository))
+
+        self.environ = dict(os.environ)
+        self.repository_data = {}
+        # Options the repository failed to read raise again when looked up.
+        self.errors = {}
+        for key in keys():
+            try:
+                self.repository_data[key] = repository[key]
+            except KeyError:
+                pass
+            except Exception as e:
+                self.errors[key] = e
+
+        # Environment beats the repository, as in Config.get.
+        self.data = dict(self.repository_data)
+        self.data.update(self.environ)
+
+        # Repositories with case insensitive options, like ini files, store
+        # them normalized.
+        self._optionxform = getattr(repository, 'optionxform', None)
+
+    def get(self, option, default=undefined, cast=undefined):
+        """
+        Return the value for option or default if defined.
+        """
+        overlay = self._overrides and self._overrides.get()
+        if overlay and option in overlay:
+            return self._get_override(option, overlay[option], cast)
+        if self.hooks:
+            return self._get_instrumented(option, default, cast)
+
+        value = self.data.get(option, undefined)
+        if value is undefined:
+            value = self._lookup(option, default)[1]
+
+        return self._cast(value, cast)
+
+    def _lookup(self, option, default):
+        if option in self.environ:
+            return 'environ', self.environ[option]
+
+        key = option
+        value = self.repository_data.get(key, undefined)
+        if value is undefined and self._optionxform is not None:
+            key = self._optionxform(option)
+            value = self.repository_data.get(key, undefined)
+        if value is not undefined:
+            return 'repository', value
+        if key in self.errors:
+            raise self.errors[key]
+
+        return 'default', self._default(option, default)
+
+    def _batch_get(self, options):
+        # Lookups are already plain dict probes.
+        return self.get
+
+    def _prefixed_options(self, prefix):
+        if self._index is None:
+            self._index = (sorted(self.environ), sorted(self.repository_data))
+        environ_index, repository_index = self._index
+        return (set(_prefixed(environ_index, prefix)),
+                _prefixed(repository_index, prefix, _optionxforms(self.repository)))
+
+    def drift(self):
+        """
+        Return the environment variables changed since the snapshot.
+
+        Maps each name to a (snapshot value, current value) tuple, where a
+        missing variable is None.
+        """
+        current = dict(os.environ)
+        return dict(
+            (key, (self.environ.get(key), current.get(key)))
+            for key in set(self.environ) | set(current)
+            if self.environ.get(key) != current.get(key)
+        )
+
+
 class RepositoryEmpty(object):
-    def __init__(self, source='', encoding=DEFAULT_ENCODING):
+    # Bumped on every reload so Config knows its cached values are stale.
+    version = 0
+    # Seconds between checks for changes on the source, None to never check.
+    reload_interval = None
+    # Callables notified after every reload, see subscribe.
+    _subscribers = ()
+    # Directory where parsed sources are kept for other processes to load.
+    cache_dir = None
+    # Why the last reload by refresh failed, None if it didn't.
+    last_error = None
+
+    def __init__(self, source='', encoding=DEFAULT_ENCODING, reload_interval=None):
         pass
 
     def __contains__(self, key):
@@ -117,53 +882,582 @@ class RepositoryEmpty(object):
     def __getitem__(self, key):
         return None
 
+    def keys(self):
+        return []
+
+    def _fetch(self, key):
+        """
+        Return the value of key, or undefined.
+
+        Used by Config.get_many, which already looked in os.environ.
+        """
+        try:
+            if key in self:
+                return self[key]
+        except KeyError:
+            pass
+        return undefined
+
+    def _load(self):
+        pass
+
+    def reload(self):
+        """
+        Read the source again.
+        """
+        self._load()
+        self.version += 1
+        for callback in self._subscribers:
+            callback(self)
+
+    def subscribe(self, callback):
+        """
+        Call callback(repository) after every reload.
+        """
+        if not self._subscribers:
+            self._subscribers = []
+        self._subscribers.append(callback)
+
+    @classmethod
+    def aload(cls, *args, **kwargs):
+        """
+        Build the repository in an executor thread and return an awaitable.
+
+        Takes the same arguments as the class, plus an optional executor.
+        """
+        from functools import partial
+
+        executor = kwargs.pop('executor', None)
+        return _event_loop().run_in_executor(executor, partial(cls, *args, **kwargs))
+
+    def _signature(self):
+        st = os.stat(self.source)
+        return (st.st_mtime, st.st_size, st.st_ino)
+
+    def _cache_identity(self):
+        return (type(self).__name__, os.path.abspath(self.source), self.encoding)
+
+    def _read_cache(self):
+        """
+        Return the cache key of the source and the data stored under it.
+
+        The data is None when the source wasn't cached yet, changed since, or
+        the cache can't be read. The key is None when caching is off.
+        """
+        if self.cache_dir is None:
+            return None, None
+
+        try:
+            signature = self._signature()
+        except (IOError, OSError):
+            # Let the parser report the missing file as usual.
+            return None, None
+
+        identity = self._cache_identity()
+        # Data is only valid for the same release and marshal format.
+        key = (__version__, tuple(PYVERSION[:2]), identity, signature)
+        import zlib
+
+        name = 'decouple-{:08x}.cache'.format(zlib.crc32(repr(identity).encode('utf-8')) & 0xffffffff)
+        self._cache_file = os.path.join(self.cache_dir, name)
+
+        try:
+            with open(self._cache_file, 'rb') as file_:
+                stored_key, data = marshal.loads(file_.read())
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return key, None
+
+        if stored_key != key:
+            return key, None
+        return key, data
+
+    def _write_cache(self, key, data):
+        """
+        Store data under key for the next processes, as one atomic replace.
+        """
+        if key is None:
+            return
+
+        import tempfile
+
+        try:
+            try:
+                os.makedirs(self.cache_dir, 0o700)
+            except OSError:
+                # Already there, or mkstemp will say why not.
+                pass
+            fd, temp = tempfile.mkstemp(dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as file_:
+                    file_.write(marshal.dumps((key, data)))
+                replace(temp, self._cache_file)
+            except Exception:
+                os.unlink(temp)
+                raise
+        except (IOError, OSError, ValueError):
+            # Without a cache the next process just parses the source again.
+            pass
+
+    def _watch(self, reload_interval):
+        if reload_interval is None:
+            return
+
+        import threading
+        self._refresh_lock = threading.Lock()
+        self._next_check = monotonic() + reload_interval
+        self._source_signature = self._signature()
+        self.reload_interval = reload_interval
+
+    def refresh(self):
+        """
+        Reload the source if it changed on disk since it was last read.
+
+        The source is checked at most once every reload_interval seconds.
+        Returns True if it was reloaded. If the new source can't be read,
+        like a malformed file, the current values are kept, the error is
+        stored in last_error and a RuntimeWarning is issued.
+        """
+        if self.reload_interval is None or monotonic() < self._next_check:
+            return False
+
+        # Someone else is already checking, keep serving the current data.
+        if not self._refresh_lock.acquire(False):
+            return False
+
+        try:
+            self._next_check = monotonic() + self.reload_interval
+            try:
+                signature = self._signature()
+                if signature == self._source_signature:
+                    return False
+                self.reload()
+                # Only now, so that a failed reload is tried again.
+                self._source_signature = signature
+            except (IOError, OSError):
+                # The file is being replaced, try again on the next check.
+                return False
+            except Exception as e:
+                # Keep serving the current values, lookups must not fail
+                # because of a bad edit. Retry once the source changes again.
+                import warnings
+
+                self._source_signature = signature
+                self.last_error = e
+                warnings.warn('Could not reload {}, keeping the values read before: {}'.format(
+                    self.source, e), RuntimeWarning)
+                return False
+            self.last_error = None
+            return True
+        finally:
+            self._refresh_lock.release()
+
 
 class RepositoryIni(RepositoryEmpty):
     """
     Retrieves option keys from .ini files.
+
+    Values of the [settings] section are read once, with interpolation
+    already resolved. Extra sections, like [production], can be given to be
+    laid over it in order.
     """
     SECTION = 'settings'
 
-    def __init__(self, source, encoding=DEFAULT_ENCODING):
-        self.parser = ConfigParser()
-        with open(source, encoding=encoding) as file_:
-            read_config(self.parser, file_)
+    def __init__(self, source, encoding=DEFAULT_ENCODING, reload_interval=None, sections=(),
+                 cache_dir=None):
+        self.source = source
+        self.encoding = encoding
+        self.sections = tuple(sections)
+        self.cache_dir = cache_dir
+        self._watch(reload_interval)
+        self._load()
+
+    def _cache_identity(self):
+        return RepositoryEmpty._cache_identity(self) + (self.sections,)
+
+    def _load(self):
+        key, data = self._read_cache()
+        if data is not None:
+            parser, errors = None, {}
+        else:
+            parser, data, errors = self._parse()
+            # Exceptions can't be stored, files with any are parsed every time.
+            if not errors:
+                self._write_cache(key, data)
+
+        self._snapshot = (parser, data, errors)
+
+    # The parser, values and options failing to interpolate. Replaced as a
+    # whole so that lookups see one version or the next.
+    _parser = property(lambda self: self._snapshot[0])
+    data = property(lambda self: self._snapshot[1])
+    errors = property(lambda self: self._snapshot[2])
+
+    def _parse(self):
+        ConfigParser, InterpolationError, _ = _configparser()
+        parser = ConfigParser()
+        with open(self.source, encoding=self.encoding) as file_:
+            read_config(parser, file_)
+
+        data = {}
+        # Options that fail to interpolate only raise when looked up.
+        errors = {}
+        for section in (self.SECTION,) + self.sections:
+            if not parser.has_section(section):
+                continue
+            for option in parser.options(section):
+                try:
+                    data[option] = parser.get(section, option)
+                    errors.pop(option, None)
+                except InterpolationError as e:
+                    errors[option] = e
+                    data.pop(option, None)
+
+        return parser, data, errors
+
+    @property
+    def parser(self):
+        """
+        The ConfigParser of the source, parsed on first use if it was cached.
+        """
+        snapshot = self._snapshot
+        parser = snapshot[0]
+        if parser is None:
+            parser = self._parse()[0]
+            # Unless the file was reloaded meanwhile.
+            if self._snapshot is snapshot:
+                self._snapshot = (parser,) + snapshot[1:]
+        return parser
 
     def __contains__(self, key):
-        return (key in os.environ or
-                self.parser.has_option(self.SECTION, key))
+        if self.reload_interval is not None:
+            self.refresh()
+        if key in os.environ:
+            return True
+        _, data, errors = self._snapshot
+        key = self.optionxform(key)
+        return key in data or key in errors
 
     def __getitem__(self, key):
+        if self.reload_interval is not None:
+            self.refresh()
+        _, data, errors = self._snapshot
+        option = self.optionxform(key)
         try:
-            return self.parser.get(self.SECTION, key)
-        except NoOptionError:
+            return data[option]
+        except KeyError:
+            if option in errors:
+                raise errors[option]
             raise KeyError(key)
 
+    def _fetch(self, key):
+        if self.reload_interval is not None:
+            self.refresh()
+        _, data, errors = self._snapshot
+        option = self.optionxform(key)
+        value = data.get(option, undefined)
+        if value is undefined and option in errors:
+            raise errors[option]
+        return value
 
-class RepositoryEnv(RepositoryEmpty):
+    def keys(self):
+        _, data, errors = self._snapshot
+        return list(data) + list(errors)
+
+    def optionxform(self, key):
+        if self._parser is None:
+            # What ConfigParser.optionxform does, without parsing the source.
+            return key.lower()
+        return self._parser.optionxform(key)
+
+
+# $$, ${NAME} or $NAME, anything else after $ is kept as is but ${.
+REFERENCE = r'\$(?:(\$)|\{([A-Za-z_][A-Za-z0-9_]*)\}|([A-Za-z_][A-Za-z0-9_]*)|(\{))'
+
+
+def _split_references(pattern, value):
     """
-    Retrieves option keys from .env files with fall back to os.environ.
+    Split value into the literal texts around its references and the names
+    they reference, so that literals has one more item than names.
     """
-    def __init__(self, source, encoding=DEFAULT_ENCODING):
-        self.data = {}
+    # Texts interleaved with the 4 groups of every match.
+    pieces = pattern.split(value)
+    literals = []
+    names = []
+    literal = [pieces[0]]
+    for i in range(1, len(pieces), 5):
+        escaped, braced, bare, brace, text = pieces[i:i + 5]
+        if escaped:
+            literal.append('$')
+        elif brace:
+            raise ExpansionError('invalid reference at {!r}'.format('$' + brace + text))
+        else:
+            literals.append(''.join(literal))
+            literal = []
+            names.append(braced or bare)
+        literal.append(text)
+    literals.append(''.join(literal))
+    return literals, names
+
+
+def _expand(data, environ):
+    """
+    Return data with its references expanded, and the errors of the keys
+    that could not be.
 
-        with open(source, encoding=encoding) as file_:
-            for line in file_:
-                line = line.strip()
-                if not line or line.startswith('#') or '=' not in line:
+    A reference is looked up in environ first, like Config does, then in
+    data. Each value is expanded once, after the values it references.
+    """
+    import re
+
+    pattern = re.compile(REFERENCE)
+    expanded = {}
+    errors = {}
+    templates = {}
+    for key, value in data.items():
+        if '$' not in value:
+            expanded[key] = value
+            continue
+        try:
+            templates[key] = _split_references(pattern, value)
+        except ExpansionError as e:
+            errors[key] = ExpansionError('Cannot expand {}: {}'.format(key, e))
+
+    referenced = set(name for _, names in templates.values() for name in names)
+    environ = _environ_subset(environ, referenced)
+
+    # Depth first through the references, the stack being the path to key.
+    for start in templates:
+        if start in expanded or start in errors:
+            continue
+        stack = [start]
+        on_stack = set(stack)
+        while stack:
+            key = stack[-1]
+            if key in expanded or key in errors:
+                on_stack.discard(stack.pop())
+                continue
+
+            literals, names = templates[key]
+            for name in names:
+                if name in environ or name in expanded:
                     continue
-                k, v = line.split('=', 1)
-                k = k.strip()
-                v = v.strip()
-                if len(v) >= 2 and ((v[0] == "'" and v[-1] == "'") or (v[0] == '"' and v[-1] == '"')):
+                if name in errors:
+                    errors[key] = ExpansionError(
+                        'Cannot expand {}: {} could not be expanded'.format(key, name))
+                elif name not in templates:
+                    errors[key] = ExpansionError('Cannot expand {}: {} is undefined'.format(key, name))
+                elif name in on_stack:
+                    cycle = stack[stack.index(name):]
+                    message = 'circular reference {}'.format(' -> '.join(cycle + [name]))
+                    for member in cycle:
+                        errors[member] = ExpansionError('Cannot expand {}: {}'.format(member, message))
+                else:
+                    stack.append(name)
+                    on_stack.add(name)
+                break
+            else:
+                values = [environ[name] if name in environ else expanded[name] for name in names]
+                parts = [literals[0]]
+                for value, literal in zip(values, literals[1:]):
+                    parts.append(value)
+                    parts.append(literal)
+                expanded[key] = ''.join(parts)
+
+    return expanded, errors
+
+
+# A line starting another assignment, which ends a multiline value early.
+# The value must not be empty, so that base64 padding doesn't match.
+ASSIGNMENT = r'\s*(?:export\s+)?[A-Za-z_][\w.]*\s*=(?!=)\s*\S'
+
+# Escape sequences understood in double quoted values, see RepositoryEnv.
+ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', '"': '"', '\\': '\\'}
+
+
+def _closing_quote(text, quote, start, escapes):
+    """
+    Return the index of the first quote in text from start, or -1.
+    """
+    if not escapes or quote != '"':
+        return text.find(quote, start)
+
+    while True:
+        end = text.find(quote, start)
+        # An even number of backslashes escape each other, not the quote.
+        backslashes = 0
+        while end > backslashes and text[end - backslashes - 1] == '\\':
+            backslashes += 1
+        if end == -1 or backslashes % 2 == 0:
+            return end
+        start = end + 1
+
+
+def _read_quoted(value, lines, lineno, escapes):
+    """
+    Return the text of the quoted value starting value, which may go on
+    over the next lines, and the number of its last line.
+
+    The text is None when the quote isn't closed, or is followed by
+    anything but a comment.
+    """
+    quote = value[0]
+    end = _closing_quote(value, quote, 1, escapes)
+    if end != -1:
+        rest = value[end + 1:].lstrip()
+        if rest and rest[0] != '#':
+            return None, lineno
+        return value[1:end], lineno
+
+    import re
+
+    assignment = re.compile(ASSIGNMENT)
+    parts = [value[1:]]
+    for index in range(lineno, len(lines)):
+        line = lines[index]
+        # Rather a forgotten quote than the rest of the file in one value.
+        if assignment.match(line):
+            return None, lineno
+        end = _closing_quote(line, quote, 0, escapes)
+        if end == -1:
+            parts.append(line)
+            continue
+        rest = line[end + 1:].strip()
+        if rest and rest[0] != '#':
+            return None, lineno
+        parts.append(line[:end])
+        return '\n'.join(parts), index + 1
+    return None, lineno
+
+
+def _unescape(value):
+    if '\\' not in value:
+        return value
+
+    import re
+
+    return re.sub(r'\\(.)', lambda match: ESCAPES.get(match.group(1), match.group(0)), value)
+
+
+class RepositoryEnv(RepositoryEmpty):
+    """
+    Retrieves option keys from .env files with fall back to os.environ.
+
+    Lines are NAME=value, optionally prefixed by export. Quoted values can
+    span lines and be followed by a # comment. With escapes, \\n, \\t, \\r,
+    \\" and \\\\ are understood in double quoted values. With strict, malformed
+    lines raise a ParseError instead of being skipped.
+
+    With interpolate, ${VAR} and $VAR in values are replaced by the value of
+    VAR, from os.environ or else from the file, once when the file is read.
+    """
+    def __init__(self, source, encoding=DEFAULT_ENCODING, reload_interval=None, cache_dir=None,
+                 interpolate=False, escapes=False, strict=False):
+        self.source = source
+        self.encoding = encoding
+        self.cache_dir = cache_dir
+        self.interpolate = interpolate
+        self.escapes = escapes
+        self.strict = strict
+        self._watch(reload_interval)
+        self._load()
+
+    def _cache_identity(self):
+        return RepositoryEmpty._cache_identity(self) + (self.escapes, self.strict)
+
+    def _load(self):
+        key, data = self._read_cache()
+        if data is None:
+            data = self._parse()
+            self._write_cache(key, data)
+
+        # Unlike the values in the file, the environment can differ between
+        # processes, so the cache holds values as written.
+        errors = {}
+        if self.interpolate:
+            data, errors = _expand(data, os.environ)
+
+        self._snapshot = (data, errors)
+
+    # Values and options failing to expand. Replaced as a whole so that
+    # lookups see one version or the next.
+    data = property(lambda self: self._snapshot[0])
+    errors = property(lambda self: self._snapshot[1])
+
+    def _parse(self):
+        with open(self.source, encoding=self.encoding) as file_:
+            lines = file_.read().split('\n')
+
+        data = {}
+        escapes = self.escapes
+        strict = self.strict
+        # Lines up to this one were read as part of a multiline value.
+        skip = 0
+        for lineno, line in enumerate(lines, 1):
+            if lineno <= skip:
+                continue
+            line = line.strip()
+            if not line:
+                continue
+            first = line[0]
+            if first == '#':
+                continue
+
+            k, sep, v = line.partition('=')
+            if not sep:
+                if strict:
+                    raise ParseError(self.source, lineno, 'expected NAME=value, got {!r}'.format(line))
+                continue
+            k = k.rstrip()
+            v = v.lstrip()
+            if first == 'e' and k.startswith('export') and k[6:7].isspace():
+                k = k[7:].lstrip()
+            if strict and len(k.split()) != 1:
+                raise ParseError(self.source, lineno, 'invalid name {!r}'.format(k))
+
+            if v and (v[0] == '"' or v[0] == "'"):
+                if len(v) >= 2 and v[-1] == v[0] and (not escapes or v[0] == "'"):
                     v = v[1:-1]
-                self.data[k] = v
+                else:
+                    text, skip = _read_quoted(v, lines, lineno, escapes)
+                    if text is not None:
+                        v = _unescape(text) if escapes and v[0] == '"' else text
+                    elif strict:
+                        raise ParseError(self.source, lineno, 'quoted value not closed, or followed by text')
+            data[k] = v
+
+        return data
 
     def __contains__(self, key):
-        return key in os.environ or key in self.data
+        if self.reload_interval is not None:
+            self.refresh()
+        if key in os.environ:
+            return True
+        data, errors = self._snapshot
+        return key in data or key in errors
 
     def __getitem__(self, key):
-        return self.data[key]
+        if self.reload_interval is not None:
+            self.refresh()
+        data, errors = self._snapshot
+        try:
+            return data[key]
+        except KeyError:
+            if key in errors:
+                raise errors[key]
+            raise
+
+    def _fetch(self, key):
+        if self.reload_interval is not None:
+            self.refresh()
+        data, errors = self._snapshot
+        value = data.get(key, undefined)
+        if value is undefined and key in errors:
+            raise errors[key]
+        return value
+
+    def keys(self):
+        data, errors = self._snapshot
+        return list(data) + list(errors)
 
 
 class RepositorySecret(RepositoryEmpty):
@@ -171,21 +1465,243 @@ class RepositorySecret(RepositoryEmpty):
     Retrieves option keys from files,
     where title of file is a key, content of file is a value
     e.g. Docker swarm secrets
+
+    Parameters
+    ----------
+    source : str, optional
+        Directory holding one file per secret.
+    lazy : bool, optional
+        Only list the file names up front and read each file on its first
+        lookup.
+    max_size : int, optional
+        Refuse to read files larger than this many bytes.
+    binary : bool, optional
+        Return the content of the files as bytes instead of text.
+    reload_interval : float, optional
+        Seconds between checks for rotated secrets, None to never check.
+
     """
 
-    def __init__(self, source='/run/secrets/'):
-        self.data = {}
+    # Kubernetes keeps its bookkeeping in entries starting with two dots,
+    # like the ..data symlink to the current version of the files.
+    DATA_LINK = '..data'
+
+    def __init__(self, source='/run/secrets/', lazy=False, max_size=None, binary=False,
+                 reload_interval=None):
+        self.source = source
+        self.lazy = lazy
+        self.max_size = max_size
+        self.binary = binary
+        self._watch(reload_interval)
+        self._load()
+
+    # Names, values read so far and, when watching, the signature of each
+    # file. Replaced as a whole so that lookups see one version or the next.
+    names = property(lambda self: self._snapshot[0])
+    data = property(lambda self: self._snapshot[1])
+
+    def _load(self):
+        names = frozenset(name for name in os.listdir(self.source) if not name.startswith('..'))
+        _, old_data, old_signatures = getattr(self, '_snapshot', (None, {}, {}))
+
+        signatures = {}
+        if self.reload_interval is not None:
+            for name in names:
+                st = os.stat(os.path.join(self.source, name))
+                signatures[name] = (st.st_mtime, st.st_size, st.st_ino)
+
+        data = {}
+        for name in names:
+            # Files untouched since the last load keep their value.
+            if name in old_data and name in signatures and signatures[name] == old_signatures.get(name):
+                data[name] = old_data[name]
+            elif not self.lazy:
+                data[name] = self._read(name)
+
+        self._snapshot = (names, data, signatures)
+
+    def _signature(self):
+        # Rotating a secret replaces its file, or swaps the ..data symlink,
+        # both of which change the directory. Files are only looked at on
+        # reload.
+        st = os.stat(self.source)
+        signature = (st.st_mtime, st.st_ino)
+        link = os.path.join(self.source, self.DATA_LINK)
+        try:
+            target = os.readlink(link)
+            st = os.stat(link)
+        except (OSError, AttributeError):
+            # No ..data symlink, or no symlinks at all.
+            return signature
+        return signature + (target, st.st_mtime, st.st_ino)
+
+    def _read(self, name):
+        with open(os.path.join(self.source, name), 'rb' if self.binary else 'r') as f:
+            if self.max_size is not None:
+                size = os.fstat(f.fileno()).st_size
+                if size > self.max_size:
+                    raise ValueError('Secret {} has {} bytes, more than max_size {}.'.format(
+                        name, size, self.max_size))
+            return f.read()
+
+    def __contains__(self, key):
+        if self.reload_interval is not None:
+            self.refresh()
+        return key in os.environ or key in self.names
+
+    def __getitem__(self, key):
+        if self.reload_interval is not None:
+            self.refresh()
+        names, data, _ = self._snapshot
+        try:
+            return data[key]
+        except KeyError:
+            if key not in names:
+                raise
+
+        value = data[key] = self._read(key)
+        return value
+
+    def _fetch(self, key):
+        if self.reload_interval is not None:
+            self.refresh()
+        return self[key] if key in self.names else undefined
+
+    def keys(self):
+        return self.names
+
+    @classmethod
+    def aload(cls, source='/run/secrets/', lazy=False, max_size=None, binary=False, reload_interval=None,
+              executor=None):
+        """
+        Build the repository in an executor, reading the files concurrently.
+        """
+        from functools import partial
+
+        loop = _event_loop()
+        listed = loop.run_in_executor(executor, partial(
+            cls, source, lazy=True, max_size=max_size, binary=binary, reload_interval=reload_interval))
+        if lazy:
+            return listed
+
+        def read_all(repository):
+            names = sorted(repository.names)
+            reads = [loop.run_in_executor(executor, repository._read, name) for name in names]
+            return _then(_gather(reads), lambda values: repository._fill(names, values))
 
-        ls = os.listdir(source)
-        for file in ls:
-            with open(os.path.join(source, file), 'r') as f:
-                self.data[file] = f.read()
+        return _then(listed, read_all)
+
+    def _fill(self, names, values):
+        all_names, _, signatures = self._snapshot
+        self._snapshot = (all_names, dict(zip(names, values)), signatures)
+        self.lazy = False
+        return self
+
+
+class RepositoryChain(RepositoryEmpty):
+    """
+    Retrieves option keys from several repositories, in order of precedence.
+
+    An index from each key to the first repository holding it is built up
+    front and rebuilt whenever one of them reloads, so a lookup is a single
+    probe whatever the number of repositories. As with any repository,
+    os.environ still comes first in Config.get.
+
+    >>> config = Config(RepositoryChain([
+    ...     RepositorySecret(), RepositoryEnv('.env'), RepositoryIni('settings.ini')]))
+    """
+
+    def __init__(self, repositories):
+        self.repositories = list(repositories)
+        # Members that may reload on their own when looked up.
+        self._watching = [r for r in self.repositories if getattr(r, 'reload_interval', None) is not None]
+        if self._watching:
+            # So that Config refreshes the chain before serving cached values.
+            self.reload_interval = min(r.reload_interval for r in self._watching)
+        for repository in self.repositories:
+            if hasattr(repository, 'subscribe'):
+                repository.subscribe(self._member_reloaded)
+        self._load()
+
+    def _load(self):
+        index = {}
+        # Case insensitive members, like ini files, can't be found by the
+        # exact key: (position, repository, optionxform, normalized keys).
+        folding = []
+        for position, repository in reversed(list(enumerate(self.repositories))):
+            keys = list(repository.keys())
+            for key in keys:
+                index[key] = (position, repository)
+            optionxform = getattr(repository, 'optionxform', None)
+            if optionxform is not None:
+                folding.insert(0, (position, repository, optionxform, frozenset(keys)))
+
+        self.folding = folding
+        self.index = index
+
+    def _member_reloaded(self, repository):
+        self._load()
+        self.version += 1
+
+    def reload(self):
+        """
+        Reload every repository and rebuild the index.
+        """
+        for repository in self.repositories:
+            if hasattr(repository, 'reload'):
+                repository.reload()
+        super(RepositoryChain, self).reload()
+
+    def refresh(self):
+        """
+        Let the repositories being watched reload if their source changed.
+
+        Returns True if any of them was reloaded.
+        """
+        reloaded = False
+        for repository in self._watching:
+            reloaded = repository.refresh() or reloaded
+        return reloaded
+
+    def layer(self, key):
+        """
+        Return the repository the value of key comes from, or None.
+        """
+        if self._watching:
+            self.refresh()
+
+        position, repository = self.index.get(key, (len(self.repositories), None))
+        for folding_position, folding_repository, optionxform, keys in self.folding:
+            if folding_position >= position:
+                break
+            if optionxform(key) in keys:
+                return folding_repository
+        return repository
 
     def __contains__(self, key):
-        return key in os.environ or key in self.data
+        return key in os.environ or self.layer(key) is not None
 
     def __getitem__(self, key):
-        return self.data[key]
+        repository = self.layer(key)
+        if repository is None:
+            raise KeyError(key)
+        return repository[key]
+
+    def keys(self):
+        return self.index.keys()
+
+    def optionxform(self, key):
+        """
+        Return the name key is stored under in the repository its value
+        comes from, like DEBUG as debug in an ini file.
+        """
+        optionxform = getattr(self.layer(key), 'optionxform', None)
+        return optionxform(key) if optionxform is not None else key
+
+
+# Config files found by AutoConfig, shared by all instances:
+# {(directory, supported names): filename or ''}
+_discovery_cache = {}
 
 
 class AutoConfig(object):
@@ -199,53 +1715,195 @@ class AutoConfig(object):
         caller's path.
 
     """
-    SUPPORTED = OrderedDict([
+    SUPPORTED = ordered_dict([
         ('settings.ini', RepositoryIni),
         ('.env', RepositoryEnv),
     ])
 
     encoding = DEFAULT_ENCODING
+    cache = False
+    reload_interval = None
+    cache_dir = None
+    # Expand ${VAR} in .env files, see RepositoryEnv.
+    interpolate = False
 
     def __init__(self, search_path=None):
         self.search_path = search_path
         self.config = None
+        # Held while loading, so concurrent first lookups load only once.
+        self._lock = allocate_lock()
+        # Directories listed by the last search for a config file.
+        self.visited = []
 
     def _find_file(self, path):
-        # look for all files in the current path
-        for configfile in self.SUPPORTED:
-            filename = os.path.join(path, configfile)
-            if os.path.isfile(filename):
-                return filename
-
-        # search the parent
-        parent = os.path.dirname(path)
-        if parent and os.path.normcase(parent) != os.path.normcase(os.path.abspath(os.sep)):
-            return self._find_file(parent)
+        names = tuple(self.SUPPORTED)
+        root = os.path.normcase(os.path.abspath(os.sep))
+        visited = []
+        filename = ''
+
+        while True:
+            key = (path, names)
+            if key in _discovery_cache:
+                filename = _discovery_cache[key]
+                break
+
+            visited.append(key)
+            filename = self._scan(path, names)
+            if filename:
+                break
+
+            # search the parent until the root, which is never searched.
+            parent = os.path.dirname(path)
+            if not parent or parent == path or os.path.normcase(parent) == root:
+                break
+            path = parent
+
+        # Every directory on the way resolves to the same file.
+        for key in visited:
+            _discovery_cache[key] = filename
+
+        self.visited = [path for path, _ in visited]
+        return filename
 
-        # reached root without finding any files.
+    @staticmethod
+    def _scan(path, names):
+        """
+        Return the first of names that is a file in path, or ''.
+        """
+        entries = None
+        if scandir is not None:
+            try:
+                # One directory listing instead of one stat per name.
+                entries = dict((entry.name, entry) for entry in scandir(path))
+            except OSError:
+                # Not a readable directory, let isfile decide as before.
+                pass
+
+        for name in names:
+            filename = os.path.join(path, name)
+            if entries is None:
+                if os.path.isfile(filename):
+                    return filename
+            elif name in entries and entries[name].is_file():
+                return filename
         return ''
 
+    @staticmethod
+    def clear_discovery_cache():
+        """
+        Forget the config files found so far by all instances.
+        """
+        _discovery_cache.clear()
+
     def _load(self, path):
         # Avoid unintended permission errors
         try:
             filename = self._find_file(os.path.abspath(path))
         except Exception:
             filename = ''
+        Repository, kwargs = self._repository(filename)
+        self.config = Config(Repository(filename, **kwargs), cache=self.cache)
+
+    def _repository(self, filename):
+        """
+        Return the repository class reading filename and its arguments.
+        """
         Repository = self.SUPPORTED.get(os.path.basename(filename), RepositoryEmpty)
 
-        self.config = Config(Repository(filename, encoding=self.encoding))
+        kwargs = {'encoding': self.encoding}
+        if filename and self.reload_interval is not None:
+            kwargs['reload_interval'] = self.reload_interval
+        if filename and self.cache_dir is not None:
+            kwargs['cache_dir'] = self.cache_dir
+        if self.interpolate and issubclass(Repository, RepositoryEnv):
+            kwargs['interpolate'] = True
+        return Repository, kwargs
+
+    def reload(self):
+        """
+        Read the config file again, discarding cached values.
+        """
+        if self.config is not None:
+            self.config.repository.reload()
 
     def _caller_path(self):
-        # MAGIC! Get the caller's module path.
+        # MAGIC! Get the caller's module path, skipping our own frames.
         frame = sys._getframe()
-        path = os.path.dirname(frame.f_back.f_back.f_code.co_filename)
+        filename = frame.f_code.co_filename
+        while frame.f_back is not None and frame.f_code.co_filename == filename:
+            frame = frame.f_back
+        path = os.path.dirname(frame.f_code.co_filename)
         return path
 
-    def __call__(self, *args, **kwargs):
-        if not self.config:
-            self._load(self.search_path or self._caller_path())
+    def _get_config(self, search_path=None):
+        config = self.config
+        if config is None:
+            with self._lock:
+                # Another thread may have loaded it while we waited.
+                if self.config is None:
+                    self._load(search_path or self.search_path or self._caller_path())
+                config = self.config
+
+        return config
+
+    def preload(self):
+        """
+        Find and read the config file now instead of on the first lookup.
+
+        Call it in a server's master process before it forks, so workers
+        inherit the loaded config instead of each loading their own.
+        Returns the Config.
+        """
+        return self._get_config()
+
+    def freeze(self):
+        """
+        Return a FrozenConfig with a snapshot of the environment and config file.
+        """
+        return self._get_config().freeze()
+
+    def override(self, **values):
+        """
+        Return a context manager reading options from values instead, see
+        Config.override.
+        """
+        return self._get_config().override(**values)
+
+    def invalidate(self):
+        """
+        Drop all cached values.
+        """
+        self._get_config().invalidate()
+
+    def cache_info(self):
+        """
+        Return the cache statistics as a dict.
+        """
+        return self._get_config().cache_info()
 
-        return self.config(*args, **kwargs)
+    def add_hook(self, hook):
+        """
+        Call hook(option, source, cast_time) after every lookup.
+        """
+        self._get_config().add_hook(hook)
+
+    def remove_hook(self, hook):
+        self._get_config().remove_hook(hook)
+
+    def record(self):
+        """
+        Start recording lookups and return the Recorder.
+        """
+        return self._get_config().record()
+
+    def get_many(self, spec):
+        return self._get_config().get_many(spec)
+
+    def get_prefixed(self, *args, **kwargs):
+        return self._get_config().get_prefixed(*args, **kwargs)
+
+    def __call__(self, *args, **kwargs):
+        return self._get_config()(*args, **kwargs)
 
 
 # A pré-instantiated AutoConfig to improve decouple's usability
@@ -254,12 +1912,17 @@ config = AutoConfig()
 
 # Helpers
 
+# Chars that make a Csv value need the full shlex parser: quotes, escape
+# and comment.
+SHLEX_CHARS = '"\'\\#'
+
+
 class Csv(object):
     """
     Produces a csv parser that return a list of transformed elements.
     """
 
-    def __init__(self, cast=text_type, delimiter=',', strip=string.whitespace, post_process=list):
+    def __init__(self, cast=text_type, delimiter=',', strip=WHITESPACE, post_process=list):
         """
         Parameters:
         cast -- callable that transforms the item just before it's added to the list.
@@ -271,19 +1934,73 @@ class Csv(object):
         self.delimiter = delimiter
         self.strip = strip
         self.post_process = post_process
+        self._compiled = None
+        # Cached lookups hash the helper every time, so the key and its
+        # hash are only computed once.
+        self._key = (cast, delimiter, strip, post_process)
+        self._hash = None
+
+    def __eq__(self, other):
+        return self is other or (type(self) is type(other) and self._key == other._key)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._key)
+        return self._hash
 
     def __call__(self, value):
         """The actual transformation"""
-        if value is None:
-            return self.post_process()
+        return self.compile()(value)
+
+    def compile(self):
+        """
+        Return a function doing the transformation, with everything it needs
+        bound to local names and nested helpers compiled too.
+        """
+        if self._compiled is not None:
+            return self._compiled
 
-        transform = lambda s: self.cast(s.strip(self.strip))
+        cast = _compile_nested(self.cast)
+        strip = self.strip
+        post_process = self.post_process
+        split = self._split
+        delimiter = self.delimiter
 
-        splitter = shlex(value, posix=True)
-        splitter.whitespace = self.delimiter
-        splitter.whitespace_split = True
+        def csv(value):
+            if value is None:
+                return post_process()
 
-        return self.post_process(transform(s) for s in splitter)
+            if isinstance(value, string_types) and not any(c in value for c in SHLEX_CHARS):
+                splitter = split(value)
+            else:
+                from shlex import shlex
+
+                splitter = shlex(value, posix=True)
+                splitter.whitespace = delimiter
+                splitter.whitespace_split = True
+
+            return post_process(cast(s.strip(strip)) for s in splitter)
+
+        self._compiled = csv
+        return csv
+
+    def _split(self, value):
+        """
+        Split a value without quotes, escapes or comments the way shlex would.
+        """
+        delimiter = self.delimiter
+        if not delimiter:
+            return [value] if value else []
+
+        # Any char in delimiter splits, so fold them all into the first one.
+        for char in delimiter[1:]:
+            value = value.replace(char, delimiter[0])
+
+        # shlex never yields the empty token between consecutive delimiters.
+        return [s for s in value.split(delimiter[0]) if s]
 
 
 class Choices(object):
@@ -291,26 +2008,507 @@ class Choices(object):
     Allows for cast and validation based on a list of choices.
     """
 
-    def __init__(self, flat=None, cast=text_type, choices=None):
+    def __init__(self, flat=None, cast=text_type, choices=None, normalize=None):
         """
         Parameters:
         flat -- a flat list of valid choices.
         cast -- callable that transforms value before validation.
         choices -- tuple of Django-like choices.
+        normalize -- callable applied to the casted value and to the choices
+                     before comparing them, e.g. str.lower. The matching
+                     choice is returned instead of the casted value.
         """
         self.flat = flat or []
         self.cast = cast
         self.choices = choices or []
+        self.normalize = normalize
 
         self._valid_values = []
         self._valid_values.extend(self.flat)
         self._valid_values.extend([value for value, _ in self.choices])
 
+        # Maps each (normalized) choice to the choice. Unhashable ones can
+        # only be found by comparing them one by one.
+        values = self._valid_values
+        keys = [normalize(v) for v in values] if normalize is not None else values
+        self._unhashable = []
+        try:
+            # Reversed so that the first of equal choices wins.
+            self._index = dict(zip(reversed(keys), reversed(values)))
+        except TypeError:
+            self._index = {}
+            for key, valid in zip(keys, values):
+                try:
+                    self._index.setdefault(key, valid)
+                except TypeError:
+                    self._unhashable.append((key, valid))
+
+        self._compiled = None
+        # Hashing thousands of choices on every cached lookup would cost more
+        # than the lookup, so the key and its hash are only computed once.
+        self._key = (cast, tuple(self.flat), tuple(self.choices), normalize)
+        self._hash = None
+
+    def __eq__(self, other):
+        return self is other or (type(self) is type(other) and self._key == other._key)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._key)
+        return self._hash
+
+    def _find(self, value):
+        """
+        Return the choice matching value, or undefined.
+        """
+        key = self.normalize(value) if self.normalize is not None else value
+        try:
+            valid = self._index.get(key, undefined)
+        except TypeError:
+            # An unhashable value may still equal any of the choices.
+            candidates = list(self._index.items()) + self._unhashable
+        else:
+            if valid is not undefined or not self._unhashable:
+                return valid
+            candidates = self._unhashable
+
+        for normalized, valid in candidates:
+            if normalized == key:
+                return valid
+        return undefined
+
     def __call__(self, value):
-        transform = self.cast(value)
-        if transform not in self._valid_values:
-            raise ValueError((
+        return self.compile()(value)
+
+    def compile(self):
+        """
+        Return a function doing the validation, with everything it needs
+        bound to local names and a nested cast helper compiled too.
+        """
+        if self._compiled is not None:
+            return self._compiled
+
+        cast = _compile_nested(self.cast)
+        find = self._find
+        index = self._index
+        normalize = self.normalize
+        valid_values = self._valid_values
+
+        def invalid(value):
+            return ValueError((
                     'Value not in list: {!r}; valid values are {!r}'
-                ).format(value, self._valid_values))
+                ).format(value, valid_values))
+
+        if normalize is None and not self._unhashable:
+            def choices(value):
+                transform = cast(value)
+                try:
+                    if transform in index:
+                        return transform
+                except TypeError:
+                    if find(transform) is not undefined:
+                        return transform
+                raise invalid(value)
+        else:
+            def choices(value):
+                transform = cast(value)
+                valid = find(transform)
+                if valid is undefined:
+                    raise invalid(value)
+                return valid if normalize is not None else transform
+
+        self._compiled = choices
+        return choices
+
+
+# Schema
+
+class Setting(object):
+    """
+    Declares one option of a Schema.
+    """
+    __slots__ = ('default', 'cast', 'option')
+
+    def __init__(self, default=undefined, cast=undefined, option=None):
+        """
+        Parameters:
+        default -- value used when the option is not defined.
+        cast -- callable that transforms the value, as in Config.get.
+        option -- name to look up, defaults to the name given in the Schema.
+        """
+        self.default = default
+        self.cast = cast
+        self.option = option
+
+
+class Settings(object):
+    """
+    Immutable result of Schema.resolve, one slot per setting.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is read-only.'.format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} is read-only.'.format(type(self).__name__))
+
+    def as_dict(self):
+        return dict((name, getattr(self, name)) for name in self.__slots__)
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(name, getattr(self, name)) for name in self.__slots__))
+
+
+class Schema(object):
+    """
+    Declares many settings to be resolved and validated together.
+
+    >>> schema = Schema(DEBUG=Setting(default=False, cast=bool),
+    ...                 ALLOWED_HOSTS=Setting(cast=Csv()))
+    >>> settings = schema.resolve(config)
+    >>> settings.DEBUG
+    False
+    """
+
+    def __init__(self, settings=None, **kwargs):
+        """
+        Parameters:
+        settings -- mapping or pairs of name and Setting.
+        kwargs -- more names and Setting.
+        """
+        self.settings = ordered_dict(settings or ())
+        self.settings.update(kwargs)
+        self.cls = type('Settings', (Settings,), {'__slots__': tuple(self.settings)})
+
+    def resolve(self, config):
+        """
+        Return a Settings with every value, or raise ConfigurationError
+        listing all the settings that are missing or invalid.
+        """
+        if isinstance(config, AutoConfig):
+            config = config._get_config()
+
+        # Only the schema's options are read, never the whole repository,
+        # which may hold large lazy secrets.
+        options = [setting.option or name for name, setting in self.settings.items()]
+        batch_get = getattr(config, '_batch_get', None)
+        get = batch_get(options) if batch_get is not None else config.get
+
+        values = []
+        errors = {}
+        for option, (name, setting) in zip(options, self.settings.items()):
+            try:
+                values.append(get(option, setting.default, setting.cast))
+            except Exception as e:
+                errors[name] = e
+
+        if errors:
+            raise ConfigurationError(errors)
+
+        settings = self.cls.__new__(self.cls)
+        for name, value in zip(self.settings, values):
+            object.__setattr__(settings, name, value)
+        return settings
+
+    __call__ = resolve
+
+
+# Asyncio
+
+def _event_loop():
+    import asyncio
+
+    try:
+        return asyncio.get_running_loop()
+    except (AttributeError, RuntimeError):
+        # Python < 3.7, or called before the loop runs.
+        return asyncio.get_event_loop()
+
+
+def _gather(futures):
+    import asyncio
+
+    return asyncio.gather(*futures)
+
+
+def _then(future, func):
+    """
+    Return a future resolved with func(result of future).
+
+    When func returns an awaitable, its result is used instead. This is how
+    the steps are chained without async syntax, which Python 2 can't parse.
+    """
+    import asyncio
+
+    result = _event_loop().create_future()
+
+    def resolve(done):
+        if result.done():
+            return
+        if done.cancelled():
+            result.cancel()
+        elif done.exception() is not None:
+            result.set_exception(done.exception())
+        else:
+            result.set_result(done.result())
+
+    def step(done):
+        if done.cancelled() or done.exception() is not None:
+            return resolve(done)
+        try:
+            value = func(done.result())
+        except Exception as e:
+            result.set_exception(e)
+            return
+        if isinstance(value, asyncio.Future):
+            value.add_done_callback(resolve)
+        else:
+            result.set_result(value)
+
+    asyncio.ensure_future(future).add_done_callback(step)
+    return result
+
+
+class AsyncConfig(object):
+    """
+    Awaitable counterpart of a Config or AutoConfig.
+
+    File discovery, parsing and reads run in an executor, so the event loop
+    is never blocked. Lookups are the same as the wrapped config's:
+
+    >>> aconfig = AsyncConfig(config)
+    >>> DEBUG = await aconfig.aget('DEBUG', default=False, cast=bool)
+
+    Parameters
+    ----------
+    config : Config or AutoConfig
+        The config to read from.
+    executor : concurrent.futures.Executor, optional
+        Where to run blocking work, defaults to the loop's executor.
+
+    """
+
+    def __init__(self, config, executor=None):
+        self.config = config
+        self.executor = executor
+        # An AutoConfig has to find the caller here, not in a worker thread.
+        if isinstance(config, AutoConfig):
+            self.search_path = config.search_path or config._caller_path()
+
+    def _run(self, func, *args, **kwargs):
+        from functools import partial
+
+        call = partial(func, *args, **kwargs)
+        if PYVERSION >= (3, 7, 0):
+            from contextvars import copy_context
+
+            # Executors don't carry the task's context, and its overrides.
+            call = partial(copy_context().run, call)
+        return _event_loop().run_in_executor(self.executor, call)
+
+    def _get_config(self):
+        config = self.config
+        if isinstance(config, AutoConfig):
+            return config._get_config(self.search_path)
+        return config
+
+    def aload(self):
+        """
+        Load the config, returning an awaitable of the Config.
+        """
+        return self._run(self._get_config)
+
+    def aget(self, option, default=undefined, cast=undefined):
+        """
+        Return an awaitable of the value for option or default if defined.
+        """
+        return self._run(lambda: self._get_config().get(option, default, cast))
+
+    __call__ = aget
+
+    def areload(self):
+        """
+        Read the config file again, returning an awaitable.
+        """
+        return self._run(lambda: self._get_config().repository.reload())
+
+
+# Command line
+
+# Casts that can be given to keys on the command line, as KEY:cast.
+COMMAND_LINE_CASTS = {
+    'str': undefined,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'csv': Csv(),
+}
+
+
+def _load_schema(path):
+    """
+    Return the Schema named by path, as module:attribute.
+    """
+    import importlib
+
+    module, _, name = path.partition(':')
+    if not name:
+        raise ValueError('Schema must be given as module:attribute, got {!r}'.format(path))
+    return getattr(importlib.import_module(module), name)
+
+
+def _parse_key(key):
+    option, _, cast = key.partition(':')
+    if cast not in COMMAND_LINE_CASTS and cast:
+        raise ValueError('Unknown cast {!r} for {}, use one of {}'.format(
+            cast, option, ', '.join(sorted(COMMAND_LINE_CASTS))))
+    return option, undefined, COMMAND_LINE_CASTS.get(cast, undefined)
+
+
+def _allocated(func):
+    """
+    Return the bytes still allocated by func's result, None if unknown.
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        # Python 2.
+        return None
+
+    tracemalloc.start()
+    try:
+        result = func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def profile(search_path, lookups=()):
+    """
+    Find and read the config file of search_path the way AutoConfig does,
+    timing each step, and look options up.
+
+    lookups are (option, default, cast) tuples. Returns a dict describing
+    the directories searched, the file and repository chosen, the time and
+    memory taken to read it, and where each option's value came from.
+    Values themselves are left out, they may be secrets.
+    """
+    autoconfig = AutoConfig(search_path)
+    search_path = os.path.abspath(search_path)
+
+    start = perf_counter()
+    filename = autoconfig._find_file(search_path)
+    find_time = perf_counter() - start
+
+    Repository, kwargs = autoconfig._repository(filename)
+    start = perf_counter()
+    repository = Repository(filename, **kwargs)
+    parse_time = perf_counter() - start
+    memory = _allocated(lambda: Repository(filename, **kwargs))
+
+    config = Config(repository)
+    recorder = config.record()
+    results = ordered_dict()
+    for option, default, cast in lookups:
+        try:
+            config.get(option, default, cast)
+        except Exception as e:
+            results[option] = {'error': '{}: {}'.format(type(e).__name__, e)}
         else:
-            return transform
+            stats = recorder.stats[option]
+            results[option] = {
+                'source': next(iter(stats['sources'])),
+                'cast_time': stats['cast_time'],
+            }
+        recorder.clear()
+
+    keys = getattr(repository, 'keys', None)
+    return {
+        'search_path': search_path,
+        'visited': autoconfig.visited,
+        'file': filename or None,
+        'repository': Repository.__name__,
+        'find_time': find_time,
+        'parse_time': parse_time,
+        'memory': memory,
+        'options': len(keys()) if keys is not None else None,
+        'lookups': results,
+    }
+
+
+def _format_profile(report):
+    lines = ['Search path: {}'.format(report['search_path']), 'Directories listed:']
+    lines.extend('  {}'.format(path) for path in report['visited'])
+    lines.extend([
+        'File: {}'.format(report['file'] or '(none found)'),
+        'Repository: {}'.format(report['repository']),
+        'Options: {}'.format('?' if report['options'] is None else report['options']),
+        'Find time: {:.3f} ms'.format(report['find_time'] * 1e3),
+        'Parse time: {:.3f} ms'.format(report['parse_time'] * 1e3),
+        'Memory: {}'.format(
+            'unknown' if report['memory'] is None else '{:.1f} KiB'.format(report['memory'] / 1024.0)),
+    ])
+    if report['lookups']:
+        lines.append('Lookups:')
+        width = max(len(option) for option in report['lookups'])
+        for option, result in report['lookups'].items():
+            if 'error' in result:
+                detail = result['error']
+            else:
+                detail = '{:<10} cast {:.3f} us'.format(result['source'], result['cast_time'] * 1e6)
+            lines.append('  {:<{}}  {}'.format(option, width, detail))
+    return '\n'.join(lines) + '\n'
+
+
+def _main(argv=None, stream=None):
+    import argparse
+
+    stream = stream or sys.stdout
+    parser = argparse.ArgumentParser(prog='python -m decouple')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    command = commands.add_parser(
+        'profile', help='show how AutoConfig finds and reads the config file')
+    command.add_argument('keys', nargs='*', metavar='KEY[:CAST]',
+                         help='options to look up, cast with one of {}'.format(
+                             ', '.join(sorted(COMMAND_LINE_CASTS))))
+    command.add_argument('--path', default=os.getcwd(),
+                         help='directory to search from, defaults to the current one')
+    command.add_argument('--schema', metavar='MODULE:NAME',
+                         help='look up the options of this Schema')
+    command.add_argument('--json', action='store_true', help='print a JSON report')
+
+    args = parser.parse_args(argv)
+    try:
+        lookups = [_parse_key(key) for key in args.keys]
+        if args.schema:
+            schema = _load_schema(args.schema)
+            lookups.extend(
+                (setting.option or name, setting.default, setting.cast)
+                for name, setting in schema.settings.items())
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+
+    report = profile(args.path, lookups)
+    if args.json:
+        import json
+
+        json.dump(report, stream, indent=2)
+        stream.write('\n')
+    else:
+        stream.write(_format_profile(report))
+
+
+if __name__ == '__main__':
+    # Run from the decouple module, not this __main__ copy, so that casts
+    # and errors of imported schemas are the same classes.
+    from decouple import _main
+    _main()
@@ -1,12 +1,19 @@
 # coding: utf-8
 from setuptools import setup
 import os
+import re
 
 
 README = os.path.join(os.path.dirname(__file__), 'README.rst')
+MODULE = os.path.join(os.path.dirname(__file__), 'decouple.py')
+
+# decouple.__version__ is the one place the version is set. It is read, not
+# imported, so that installing never runs the module.
+with open(MODULE) as f:
+    VERSION = re.search(r"^__version__ = '([^']+)'", f.read(), re.M).group(1)
 
 setup(name='python-decouple',
-      version='3.8',
+      version=VERSION,
       description='Strict separation of settings from code.',
       long_description=open(README).read(),
       author="Henrique Bastos", author_email="henrique@bastos.net",
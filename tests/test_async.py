@@ -0,0 +1,88 @@
+# coding: utf-8
+import os
+import pytest
+from decouple import (Config, AutoConfig, AsyncConfig, RepositoryEnv, RepositoryIni,
+                      RepositorySecret, UndefinedValueError)
+
+asyncio = pytest.importorskip('asyncio')
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(None)
+
+
+def test_async_repository_env(loop, tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=value\n')
+
+    repository = loop.run_until_complete(RepositoryEnv.aload(str(envfile)))
+    assert 'value' == repository['KEY']
+
+
+def test_async_repository_ini(loop, tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nKEY=value\n')
+
+    repository = loop.run_until_complete(RepositoryIni.aload(str(inifile), encoding='UTF-8'))
+    assert 'value' == repository['KEY']
+
+
+def test_async_repository_secret(loop):
+    path = os.path.join(os.path.dirname(__file__), 'secrets')
+    repository = loop.run_until_complete(RepositorySecret.aload(path))
+
+    assert {'db_user': 'hello', 'db_password': 'world'} == repository.data
+    assert False is repository.lazy
+
+
+def test_async_repository_secret_lazy(loop):
+    path = os.path.join(os.path.dirname(__file__), 'secrets')
+    repository = loop.run_until_complete(RepositorySecret.aload(path, lazy=True))
+
+    assert {} == repository.data
+    assert 'hello' == repository['db_user']
+
+
+def test_async_repository_secret_error(loop):
+    path = os.path.join(os.path.dirname(__file__), 'secrets')
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(RepositorySecret.aload(path, max_size=1))
+
+
+def test_async_config_aget(loop, tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('DEBUG=True\n')
+    aconfig = AsyncConfig(Config(RepositoryEnv(str(envfile))))
+
+    assert True is loop.run_until_complete(aconfig.aget('DEBUG', cast=bool))
+    assert 'default' == loop.run_until_complete(aconfig('Undefined', default='default'))
+
+    with pytest.raises(UndefinedValueError):
+        loop.run_until_complete(aconfig.aget('Undefined'))
+
+
+def test_async_config_areload(loop, tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=old\n')
+    aconfig = AsyncConfig(Config(RepositoryEnv(str(envfile)), cache=True))
+    assert 'old' == loop.run_until_complete(aconfig.aget('KEY'))
+
+    envfile.write('KEY=new\n')
+    loop.run_until_complete(aconfig.areload())
+    assert 'new' == loop.run_until_complete(aconfig.aget('KEY'))
+
+
+def test_async_autoconfig(loop):
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    config = AutoConfig(path)
+    aconfig = AsyncConfig(config)
+
+    loaded = loop.run_until_complete(aconfig.aload())
+    assert loaded is config.config
+    assert 'INI' == loop.run_until_complete(aconfig.aget('KEY'))
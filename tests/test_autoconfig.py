@@ -107,3 +107,94 @@ def test_autoconfig_no_repository():
         config('KeyNotInEnvAndNotInRepository')
 
     assert isinstance(config.config.repository, RepositoryEmpty)
+
+
+def test_autoconfig_reload_interval():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    config = AutoConfig(path)
+    config.reload_interval = 5
+    assert 'INI' == config('KEY')
+    assert 5 == config.config.repository.reload_interval
+
+
+def test_autoconfig_discovery_is_shared():
+    AutoConfig.clear_discovery_cache()
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project', 'subdir')
+    filename = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project', 'settings.ini')
+    assert filename == AutoConfig()._find_file(path)
+
+    with patch('decouple.scandir') as scandir:
+        assert filename == AutoConfig()._find_file(path)
+        assert filename == AutoConfig()._find_file(os.path.dirname(path))
+        assert not scandir.called
+
+
+def test_autoconfig_clear_discovery_cache():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    AutoConfig()._find_file(path)
+    AutoConfig.clear_discovery_cache()
+
+    with patch('decouple.scandir', return_value=[]) as scandir:
+        AutoConfig()._find_file(path)
+        assert scandir.called
+    AutoConfig.clear_discovery_cache()
+
+
+def test_autoconfig_unreadable_dir_falls_back_to_isfile():
+    AutoConfig.clear_discovery_cache()
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    filename = os.path.join(path, 'settings.ini')
+
+    with patch('decouple.scandir', side_effect=OSError('PermissionDenied')):
+        assert filename == AutoConfig()._find_file(path)
+    AutoConfig.clear_discovery_cache()
+
+
+def test_autoconfig_preload():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    config = AutoConfig(path)
+    loaded = config.preload()
+    assert loaded is config.config
+    assert loaded is config.preload()
+    assert 'INI' == config('KEY')
+
+
+def test_autoconfig_loads_once_under_concurrency():
+    import threading
+    import time
+
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    config = AutoConfig(path)
+    load = config._load
+    calls = []
+
+    def slow_load(path):
+        calls.append(path)
+        # Give every thread the chance to find the config not loaded yet.
+        time.sleep(0.05)
+        load(path)
+
+    start = threading.Event()
+    results = []
+
+    def lookup():
+        start.wait()
+        results.append(config('KEY'))
+
+    with patch.object(config, '_load', side_effect=slow_load):
+        threads = [threading.Thread(target=lookup) for _ in range(32)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+
+    assert 1 == len(calls)
+    assert ['INI'] * 32 == results
+
+
+def test_autoconfig_interpolate(tmpdir):
+    tmpdir.join('.env').write('NAME=world\nGREETING=hello ${NAME}\n')
+    config = AutoConfig(str(tmpdir))
+    config.interpolate = True
+    assert 'hello world' == config('GREETING')
@@ -0,0 +1,207 @@
+# coding: utf-8
+import os
+import sys
+from mock import patch, Mock
+import pytest
+from decouple import Config, RepositoryEmpty, RepositoryEnv, AutoConfig, Csv, Choices, LRUCache, UndefinedValueError
+
+# Useful for very coarse version differentiation.
+PY3 = sys.version_info[0] == 3
+
+if PY3:
+    from io import StringIO
+else:
+    from io import BytesIO as StringIO
+
+
+ENVFILE = '''
+ALLOWED_HOSTS=.localhost, .herokuapp.com
+DEBUG=True
+'''
+
+
+@pytest.fixture
+def config():
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        return Config(RepositoryEnv('.env'), cache=True)
+
+
+def test_cache_disabled_by_default():
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        config = Config(RepositoryEnv('.env'))
+
+    assert True is config('DEBUG', cast=bool)
+    assert {'hits': 0, 'misses': 0, 'size': 0} == config.cache_info()
+
+
+def test_cache_hit(config):
+    assert ['.localhost', '.herokuapp.com'] == config('ALLOWED_HOSTS', cast=Csv())
+
+    with patch.object(Csv, '__call__') as csv:
+        assert ['.localhost', '.herokuapp.com'] == config('ALLOWED_HOSTS', cast=Csv())
+        assert not csv.called
+
+    assert {'hits': 1, 'misses': 1, 'size': 1} == config.cache_info()
+
+
+def test_cache_key_includes_cast_and_default(config):
+    assert 'True' == config('DEBUG')
+    assert True is config('DEBUG', cast=bool)
+    assert 1 == config('UndefinedKey', default=1)
+    assert True is config('UndefinedKey', default=True)
+    assert {'hits': 0, 'misses': 4, 'size': 4} == config.cache_info()
+
+
+def test_cache_equal_helpers_share_entry(config):
+    config('DEBUG', cast=Choices(['True', 'False']))
+    config('DEBUG', cast=Choices(['True', 'False']))
+    assert 1 == config.cache_hits
+
+
+def test_cache_unhashable_default(config):
+    assert ['a'] == config('UndefinedKey', default=['a'])
+    assert 0 == config.cache_info()['size']
+
+
+def test_cache_undefined_is_not_cached(config):
+    with pytest.raises(UndefinedValueError):
+        config('UndefinedKey')
+    assert 0 == config.cache_info()['size']
+
+
+def test_cache_invalidate(config):
+    config('DEBUG')
+    os.environ['DEBUG'] = 'False'
+    assert 'True' == config('DEBUG')
+    config.invalidate()
+    assert 'False' == config('DEBUG')
+    del os.environ['DEBUG']
+
+
+def test_cache_invalidated_on_reload(config):
+    assert 'True' == config('DEBUG')
+
+    with patch('decouple.open', return_value=StringIO('DEBUG=False'), create=True):
+        config.repository.reload()
+
+    assert 'False' == config('DEBUG')
+    assert 0 == config.cache_hits
+
+
+def test_autoconfig_cache():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'env', 'custom-path')
+    config = AutoConfig(path)
+    config.cache = True
+
+    config('KEY')
+    config('KEY')
+    assert 1 == config.config.cache_hits
+
+    config.reload()
+    config('KEY')
+    assert 1 == config.config.cache_hits
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        config = Config(RepositoryEnv('.env'), cache=cache)
+
+    config('DEBUG')
+    config('ALLOWED_HOSTS')
+    config('DEBUG')
+    config('UndefinedKey', default=1)
+
+    assert 2 == len(cache)
+    config('DEBUG')
+    assert {'hits': 2, 'misses': 3, 'size': 2, 'maxsize': 2, 'evictions': 1, 'expirations': 0} \
+        == config.cache_info()
+
+
+def test_lru_cache_stays_bounded():
+    cache = LRUCache(maxsize=10)
+    config = Config(RepositoryEmpty(), cache=cache)
+
+    for i in range(1000):
+        assert i == config('TENANT_{}'.format(i), default=i)
+
+    assert 10 == len(cache)
+    assert 990 == cache.evictions
+
+
+def test_lru_cache_ttl(config):
+    config._cache = cache = LRUCache(ttl=60)
+
+    with patch('decouple.monotonic', return_value=0):
+        assert 'True' == config('DEBUG')
+        os.environ['DEBUG'] = 'False'
+    with patch('decouple.monotonic', return_value=59):
+        assert 'True' == config('DEBUG')
+    try:
+        with patch('decouple.monotonic', return_value=60):
+            assert 'False' == config('DEBUG')
+    finally:
+        del os.environ['DEBUG']
+
+    assert 1 == cache.expirations
+    assert 1 == len(cache)
+
+
+def test_lru_cache_invalidate(config):
+    config._cache = cache = LRUCache()
+    config('DEBUG')
+    config.invalidate()
+    assert 0 == len(cache)
+
+
+def test_lru_cache_key_evicted_while_stored(config):
+    config._cache = cache = LRUCache()
+    # Another thread evicts the key between storing and moving it.
+    cache._move_to_end = Mock(side_effect=KeyError('DEBUG'))
+
+    assert 'True' == config('DEBUG')
+    assert 'True' == config('DEBUG')
+
+
+def test_lru_cache_rejects_empty_bound():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+@pytest.mark.parametrize('helper', [Csv(), Choices(list(range(50000)))])
+def test_cache_helper_hash_computed_once(helper):
+    expected = hash(helper)
+    with patch('decouple.hash', side_effect=AssertionError('hash recomputed'), create=True):
+        assert expected == hash(helper)
+
+
+def test_autoconfig_invalidate_and_cache_info():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'env', 'custom-path')
+    config = AutoConfig(path)
+    config.cache = True
+
+    config('KEY')
+    config('KEY')
+    assert {'hits': 1, 'misses': 1, 'size': 1} == config.cache_info()
+
+    config.invalidate()
+    assert 0 == config.cache_info()['size']
+
+
+def test_cache_value_read_before_reload_is_not_served(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('A=old\nB=old\n')
+    repository = RepositoryEnv(str(envfile))
+    config = Config(repository, cache=True)
+
+    def reload_meanwhile(value):
+        # Another thread reloads and looks up while this lookup casts.
+        if repository.version == 0:
+            envfile.write('A=new\nB=new\n')
+            repository.reload()
+            config('B')
+        return value
+
+    assert 'old' == config('A', cast=reload_meanwhile)
+    assert 'new' == repository['A']
+    assert 'new' == config('A', cast=reload_meanwhile)
@@ -0,0 +1,94 @@
+# coding: utf-8
+import pytest
+from mock import patch
+from decouple import (Config, RepositoryEmpty, Csv, Choices, CASTS, register_cast, compile_cast,
+                      strtobool)
+
+
+@pytest.fixture
+def config():
+    return Config(RepositoryEmpty())
+
+
+@pytest.fixture
+def casts():
+    saved = dict(CASTS)
+    yield CASTS
+    CASTS.clear()
+    CASTS.update(saved)
+
+
+@pytest.mark.parametrize('value', ['y', 'Yes', 'TRUE', 'on', 'On', '1', 'tRuE', True, 1])
+def test_bool_true(config, value):
+    assert config.get('MISSING', default=value, cast=bool) is True
+
+
+@pytest.mark.parametrize('value', ['n', 'No', 'FALSE', 'off', 'Off', '0', 'fAlSe', '', False, 0])
+def test_bool_false(config, value):
+    assert config.get('MISSING', default=value, cast=bool) is False
+
+
+@pytest.mark.parametrize('value', ['maybe', 2, 1.0, None])
+def test_bool_invalid_matches_strtobool(config, value):
+    with pytest.raises(ValueError) as error:
+        config.get('MISSING', default=value, cast=bool)
+    with pytest.raises(ValueError) as expected:
+        strtobool(str(value))
+    assert str(error.value) == str(expected.value)
+
+
+def test_cast_boolean_subclass_override():
+    class StrictConfig(Config):
+        def _cast_boolean(self, value):
+            return value == 'enabled'
+
+    config = StrictConfig(RepositoryEmpty())
+    assert True is config.get('MISSING', default='enabled', cast=bool)
+    assert False is config.get('MISSING', default='yes', cast=bool)
+
+
+def test_cast_compatibility_aliases(config):
+    assert True is config._cast_boolean('yes')
+    assert 'value' == Config._cast_do_nothing('value')
+
+
+def test_register_cast(config, casts):
+    register_cast(int, lambda value: int(value, 16))
+    with patch.dict('os.environ', {'KEY': 'ff'}):
+        assert config('KEY', cast=int) == 255
+
+
+def test_registry_not_used_for_nested_casts(config):
+    with patch.dict('os.environ', {'KEY': 'a, , b'}):
+        assert config('KEY', cast=Csv(bool)) == [True, False, True]
+
+
+def test_unhashable_cast(config):
+    class Cast(object):
+        __hash__ = None
+
+        def __call__(self, value):
+            return value * 2
+
+    with patch.dict('os.environ', {'KEY': 'ab'}):
+        assert config('KEY', cast=Cast()) == 'abab'
+
+
+def test_helpers_compile_once():
+    csv = Csv(cast=Choices(['a', 'b']))
+    assert csv.compile() is csv.compile()
+    assert compile_cast(csv) is csv.compile()
+    assert csv('a, b, a') == ['a', 'b', 'a']
+
+
+def test_nested_helper_errors():
+    csv = Csv(cast=Choices(['a', 'b']))
+    with pytest.raises(ValueError, match="Value not in list: 'c'; valid values are \\['a', 'b'\\]"):
+        csv('a, c')
+
+
+def test_nested_csv_in_choices():
+    choices = Choices([['a', 'b'], ['c']], cast=Csv())
+    assert choices('a, b') == ['a', 'b']
+    with pytest.raises(ValueError):
+        choices('a')
@@ -0,0 +1,132 @@
+# coding: utf-8
+import os
+import pytest
+from decouple import (Config, RepositoryChain, RepositoryEnv, RepositoryIni, RepositorySecret,
+                      UndefinedValueError)
+
+
+@pytest.fixture
+def files(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('db_user=env\nKeyEnv=env\nKeyBoth=env\n')
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nKeyIni=ini\nKeyBoth=ini\nKeyUpper=ini\n')
+    return envfile, inifile
+
+
+@pytest.fixture
+def chain(files):
+    envfile, inifile = files
+    secrets = os.path.join(os.path.dirname(__file__), 'secrets')
+    return RepositoryChain([
+        RepositorySecret(secrets),
+        RepositoryEnv(str(envfile)),
+        RepositoryIni(str(inifile)),
+    ])
+
+
+def test_chain_precedence(chain):
+    config = Config(chain)
+
+    assert 'hello' == config('db_user')
+    assert 'env' == config('KeyEnv')
+    assert 'env' == config('KeyBoth')
+    assert 'ini' == config('KeyIni')
+    assert 'ini' == config('KEYUPPER')
+
+    with pytest.raises(UndefinedValueError):
+        config('UndefinedKey')
+
+    with pytest.raises(KeyError):
+        chain['UndefinedKey']
+
+
+def test_chain_layer(chain):
+    secrets, env, ini = chain.repositories
+
+    assert secrets is chain.layer('db_user')
+    assert env is chain.layer('KeyBoth')
+    assert ini is chain.layer('KeyIni')
+    assert None is chain.layer('UndefinedKey')
+
+
+def test_chain_case_insensitive_layer_keeps_precedence(files):
+    envfile, inifile = files
+    chain = RepositoryChain([RepositoryIni(str(inifile)), RepositoryEnv(str(envfile))])
+
+    assert 'ini' == chain['KeyBoth']
+    assert 'env' == chain['KeyEnv']
+
+
+def test_chain_environ_first(chain):
+    os.environ['KeyBoth'] = 'environ'
+    assert 'environ' == Config(chain)('KeyBoth')
+    del os.environ['KeyBoth']
+
+
+def test_chain_member_reload(chain, files):
+    envfile, inifile = files
+    config = Config(chain, cache=True)
+    assert 'ini' == config('KeyIni')
+
+    envfile.write('KeyIni=env\n')
+    chain.repositories[1].reload()
+
+    assert 'env' == config('KeyIni')
+    assert None is chain.layer('KeyEnv')
+
+
+def test_chain_reload(chain, files):
+    envfile, inifile = files
+    inifile.write('[settings]\nKeyNew=ini\n')
+    chain.reload()
+
+    assert 'ini' == chain['KeyNew']
+    assert 'KeyIni' not in chain
+
+
+def test_chain_watching_member(files):
+    envfile, inifile = files
+    chain = RepositoryChain([RepositoryEnv(str(envfile), reload_interval=0)])
+
+    envfile.write('KeyAdded=env\n')
+    assert 'KeyAdded' in chain
+
+
+def test_chain_of_mappings():
+    chain = RepositoryChain([{'Key': 'first'}, {'Key': 'second', 'Other': 'second'}])
+
+    assert 'first' == chain['Key']
+    assert 'second' == chain['Other']
+    assert set(['Key', 'Other']) == set(chain.keys())
+
+
+def test_chain_freeze_case_insensitive(files):
+    envfile, inifile = files
+    inifile.write('[settings]\nDEBUG=True\n')
+    config = Config(RepositoryChain([RepositoryEnv(str(envfile)), RepositoryIni(str(inifile))]))
+
+    assert 'True' == config('DEBUG')
+    assert 'True' == config.freeze()('DEBUG')
+    # Env files are case sensitive, db_user is not DB_USER.
+    with pytest.raises(UndefinedValueError):
+        config.freeze()('DB_USER')
+
+
+def test_chain_get_prefixed_case_insensitive(files):
+    envfile, inifile = files
+    inifile.write('[settings]\nWIDGET_COLOR=red\n')
+    config = Config(RepositoryChain([RepositoryEnv(str(envfile)), RepositoryIni(str(inifile))]))
+
+    assert {'color': 'red'} == config.get_prefixed('WIDGET_')
+    assert {'color': 'red'} == config.freeze().get_prefixed('WIDGET_')
+
+
+def test_chain_cache_sees_watching_member_reload(files):
+    envfile, inifile = files
+    envfile.write('KEY=1\n')
+    config = Config(RepositoryChain([RepositoryEnv(str(envfile), reload_interval=0)]), cache=True)
+    assert '1' == config('KEY')
+
+    envfile.write('KEY=22\n')
+    assert '22' == config('KEY')
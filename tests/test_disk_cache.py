@@ -0,0 +1,125 @@
+# coding: utf-8
+import os
+import pytest
+from mock import patch
+from decouple import Config, RepositoryEnv, RepositoryIni, AutoConfig, InterpolationError
+
+
+@pytest.fixture
+def envfile(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=value\nOTHER="quoted"\n')
+    return envfile
+
+
+@pytest.fixture
+def inifile(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nKEY=value\nPATH=%(KEY)s/path\n[production]\nKEY=prod\n')
+    return inifile
+
+
+@pytest.fixture
+def cache_dir(tmpdir):
+    return str(tmpdir.join('cache'))
+
+
+def cache_files(cache_dir):
+    return [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+
+
+def test_env_cache_is_written(envfile, cache_dir):
+    RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    assert 1 == len(cache_files(cache_dir))
+
+
+def test_env_loads_from_cache(envfile, cache_dir):
+    RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    with patch.object(RepositoryEnv, '_parse') as parse:
+        repository = RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    assert not parse.called
+    assert 'value' == repository['KEY']
+    assert 'quoted' == repository['OTHER']
+
+
+def test_env_cache_misses_when_file_changes(envfile, cache_dir):
+    RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    envfile.write('KEY=changed value\n')
+    repository = RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    assert 'changed value' == repository['KEY']
+    assert 'OTHER' not in repository
+
+
+def test_env_cache_misses_on_other_version(envfile, cache_dir):
+    RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    with patch('decouple.__version__', '0.0'):
+        with patch.object(RepositoryEnv, '_parse', return_value={'KEY': 'parsed'}):
+            repository = RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    assert 'parsed' == repository['KEY']
+
+
+def test_env_corrupt_cache_falls_back_to_parsing(envfile, cache_dir):
+    RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    for filename in cache_files(cache_dir):
+        with open(filename, 'wb') as f:
+            f.write(b'\x00garbage')
+    repository = RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    assert 'value' == repository['KEY']
+
+    # The corrupt cache was replaced.
+    with patch.object(RepositoryEnv, '_parse') as parse:
+        RepositoryEnv(str(envfile), cache_dir=cache_dir)
+    assert not parse.called
+
+
+def test_env_unwritable_cache_dir(envfile, tmpdir):
+    cache_dir = tmpdir.join('file')
+    cache_dir.write('')
+    repository = RepositoryEnv(str(envfile), cache_dir=str(cache_dir))
+    assert 'value' == repository['KEY']
+
+
+def test_missing_file_with_cache(tmpdir, cache_dir):
+    with pytest.raises((IOError, OSError)):
+        RepositoryEnv(str(tmpdir.join('missing.env')), cache_dir=cache_dir)
+
+
+def test_ini_loads_from_cache(inifile, cache_dir):
+    RepositoryIni(str(inifile), cache_dir=cache_dir)
+    with patch.object(RepositoryIni, '_parse') as parse:
+        config = Config(RepositoryIni(str(inifile), cache_dir=cache_dir))
+        assert 'value/path' == config('path')
+        assert 'value' == config('KEY')
+    assert not parse.called
+
+
+def test_ini_parser_is_parsed_on_demand(inifile, cache_dir):
+    RepositoryIni(str(inifile), cache_dir=cache_dir)
+    repository = RepositoryIni(str(inifile), cache_dir=cache_dir)
+    assert repository._parser is None
+    assert 'value' == repository.parser.get('settings', 'KEY')
+
+
+def test_ini_sections_are_cached_apart(inifile, cache_dir):
+    RepositoryIni(str(inifile), cache_dir=cache_dir)
+    repository = RepositoryIni(str(inifile), cache_dir=cache_dir, sections=['production'])
+    assert 'prod' == repository['KEY']
+    assert 2 == len(cache_files(cache_dir))
+
+
+def test_ini_with_interpolation_errors_is_not_cached(tmpdir, cache_dir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nKEY=%(MISSING)s\n')
+    repository = RepositoryIni(str(inifile), cache_dir=cache_dir)
+    assert not os.path.exists(cache_dir) or not cache_files(cache_dir)
+    with pytest.raises(InterpolationError):
+        repository['KEY']
+
+
+def test_autoconfig_cache_dir(tmpdir, cache_dir):
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    config = AutoConfig(path)
+    config.cache_dir = cache_dir
+    assert 'INI' == config('KEY')
+    assert cache_dir == config.config.repository.cache_dir
+    assert 1 == len(cache_files(cache_dir))
@@ -3,7 +3,7 @@ import os
 import sys
 from mock import patch
 import pytest
-from decouple import Config, RepositoryEnv, UndefinedValueError
+from decouple import Config, RepositoryEnv, UndefinedValueError, ExpansionError, ParseError
 
 
 # Useful for very coarse version differentiation.
@@ -140,3 +140,231 @@ def test_env_with_quote(config):
 def test_env_repo_keyerror(config):
     with pytest.raises(KeyError):
         config.repository['UndefinedKey']
+
+
+def test_env_reload_on_change(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=old\n')
+    repository = RepositoryEnv(str(envfile), reload_interval=0)
+    config = Config(repository, cache=True)
+    assert 'old' == config('KEY')
+
+    envfile.write('KEY=newer\n')
+    assert 'newer' == config('KEY')
+    assert 1 == repository.version
+
+
+def test_env_reload_checks_once_per_interval(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=old\n')
+    repository = RepositoryEnv(str(envfile), reload_interval=60)
+    envfile.write('KEY=newer\n')
+
+    with patch('os.stat') as stat:
+        assert 'old' == repository['KEY']
+        assert not stat.called
+
+
+def test_env_reload_unchanged_file(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=old\n')
+    repository = RepositoryEnv(str(envfile), reload_interval=0)
+
+    assert False is repository.refresh()
+    assert 0 == repository.version
+
+
+def test_env_reload_swaps_data_and_errors_together(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=${MISSING}\n')
+    repository = RepositoryEnv(str(envfile), reload_interval=0, interpolate=True)
+    snapshot = repository._snapshot
+
+    envfile.write('KEY=value\nOTHER=${MISSING}\n')
+    assert 'value' == repository['KEY']
+
+    # Readers holding the previous version keep a consistent one.
+    assert ({}, ['KEY']) == (snapshot[0], list(snapshot[1]))
+    assert ['OTHER'] == list(repository.errors)
+
+
+def test_env_reload_keeps_values_of_malformed_file(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=old\n')
+    repository = RepositoryEnv(str(envfile), reload_interval=0, strict=True)
+
+    envfile.write('KEY=new\nnot an assignment\n')
+    with pytest.warns(RuntimeWarning):
+        assert 'old' == repository['KEY']
+    assert isinstance(repository.last_error, ParseError)
+
+    # Not parsed again until the file changes.
+    with patch.object(repository, '_parse') as parse:
+        assert 'old' == repository['KEY']
+        assert not parse.called
+
+
+def test_env_reload_keeps_data_while_file_is_missing(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('KEY=old\n')
+    repository = RepositoryEnv(str(envfile), reload_interval=0)
+    envfile.remove()
+
+    assert 'old' == repository['KEY']
+
+
+INTERPOLATED = '''
+DB_USER=admin
+DB_HOST=${DB_HOST_NAME}:5432
+DB_HOST_NAME=localhost
+DATABASE_URL=postgres://${DB_USER}@${DB_HOST}/app
+BARE=$DB_USER-suffix
+PRICE=$$5
+NOT_A_NAME=a $ b $1
+FROM_ENV=${FROM_ENVIRON}
+OVERRIDDEN=${DB_USER}
+LOOP_A=${LOOP_B}
+LOOP_B=${LOOP_A}
+AFTER_LOOP=${LOOP_A}
+MISSING=${NOT_DEFINED}
+BAD=${not closed
+'''
+
+
+@pytest.fixture
+def interpolated():
+    environ = {'FROM_ENVIRON': 'environ', 'DB_USER': 'root'}
+    with patch.dict(os.environ, environ):
+        with patch('decouple.open', return_value=StringIO(INTERPOLATED), create=True):
+            yield Config(RepositoryEnv('.env', interpolate=True))
+
+
+def test_env_no_interpolation_by_default():
+    with patch('decouple.open', return_value=StringIO(INTERPOLATED), create=True):
+        config = Config(RepositoryEnv('.env'))
+    assert 'postgres://${DB_USER}@${DB_HOST}/app' == config('DATABASE_URL')
+
+
+def test_env_interpolation(interpolated):
+    assert 'localhost:5432' == interpolated('DB_HOST')
+    assert 'root-suffix' == interpolated('BARE')
+    assert '$5' == interpolated('PRICE')
+    assert 'a $ b $1' == interpolated('NOT_A_NAME')
+    assert 'environ' == interpolated('FROM_ENV')
+
+
+def test_env_interpolation_prefers_environ(interpolated):
+    assert 'root' == interpolated('OVERRIDDEN')
+    assert 'postgres://root@localhost:5432/app' == interpolated('DATABASE_URL')
+
+
+def test_env_interpolation_is_done_once(interpolated):
+    assert 'localhost:5432' == interpolated.repository.data['DB_HOST']
+
+
+def test_env_interpolation_cycle(interpolated):
+    with pytest.raises(ExpansionError, match='circular reference'):
+        interpolated('LOOP_A')
+    with pytest.raises(ExpansionError, match='LOOP_A could not be expanded'):
+        interpolated('AFTER_LOOP')
+
+
+def test_env_interpolation_errors(interpolated):
+    with pytest.raises(ExpansionError, match='NOT_DEFINED is undefined'):
+        interpolated('MISSING')
+    with pytest.raises(ExpansionError, match='invalid reference'):
+        interpolated('BAD')
+    assert 'BAD' in interpolated.repository
+    assert 'BAD' in interpolated.repository.keys()
+
+
+SYNTAX = '''
+export EXPORTED=value
+export\tTABBED=value
+exporter=not a prefix
+DOUBLE_COMMENT="value" # a comment
+SINGLE_COMMENT='value'   # a comment
+HASH_IN_QUOTES="a # b"
+UNQUOTED_HASH=value # kept
+TEXT_AFTER_QUOTE="value" text
+PEM="-----BEGIN KEY-----
+MIIBOgIBAAJBAKj34GkxFhD9
+0d8VFsdfxvY==
+-----END KEY-----"
+SINGLE_MULTILINE='one
+two'   # a comment
+ESCAPED="a\\tb\\nc \\"q\\" \\\\ \\x"
+ESCAPED_SINGLE='a\\nb'
+UNCLOSED="value
+NEXT=next
+'''
+
+
+def parse(text, **kwargs):
+    with patch('decouple.open', return_value=StringIO(text), create=True):
+        return RepositoryEnv('.env', **kwargs)
+
+
+@pytest.fixture(scope='module')
+def syntax():
+    return parse(SYNTAX)
+
+
+def test_env_export(syntax):
+    assert 'value' == syntax['EXPORTED']
+    assert 'value' == syntax['TABBED']
+    assert 'not a prefix' == syntax['exporter']
+
+
+def test_env_comment_after_quotes(syntax):
+    assert 'value' == syntax['DOUBLE_COMMENT']
+    assert 'value' == syntax['SINGLE_COMMENT']
+    assert 'a # b' == syntax['HASH_IN_QUOTES']
+    assert 'value # kept' == syntax['UNQUOTED_HASH']
+    assert '"value" text' == syntax['TEXT_AFTER_QUOTE']
+
+
+def test_env_multiline(syntax):
+    assert '-----BEGIN KEY-----\nMIIBOgIBAAJBAKj34GkxFhD9\n0d8VFsdfxvY==\n-----END KEY-----' == syntax['PEM']
+    assert 'one\ntwo' == syntax['SINGLE_MULTILINE']
+
+
+def test_env_unclosed_quote_stops_at_next_assignment(syntax):
+    assert '"value' == syntax['UNCLOSED']
+    assert 'next' == syntax['NEXT']
+
+
+def test_env_escapes_are_off_by_default(syntax):
+    assert 'a\\tb\\nc \\"q\\" \\\\ \\x' == syntax['ESCAPED']
+
+
+def test_env_escapes():
+    repository = parse(SYNTAX, escapes=True)
+    assert 'a\tb\nc "q" \\ \\x' == repository['ESCAPED']
+    assert 'a\\nb' == repository['ESCAPED_SINGLE']
+    assert 'value' == repository['DOUBLE_COMMENT']
+
+
+def test_env_escaped_quote_does_not_close():
+    repository = parse('KEY="say \\"hi\\"" # comment\n', escapes=True)
+    assert 'say "hi"' == repository['KEY']
+
+
+def test_env_strict_accepts_valid_files():
+    repository = parse(SYNTAX.replace('UNCLOSED="value\n', '').replace('TEXT_AFTER_QUOTE="value" text\n', ''),
+                       strict=True)
+    assert 'value' == repository['EXPORTED']
+
+
+@pytest.mark.parametrize('text, lineno, message', [
+    ('A=1\nB\n', 2, 'expected NAME=value'),
+    ('A=1\n\n# comment\nTWO WORDS=1\n', 4, 'invalid name'),
+    ('=1\n', 1, 'invalid name'),
+    ('A="1\nB=2\n', 1, 'quoted value'),
+    ('A="1" junk\n', 1, 'quoted value'),
+])
+def test_env_strict_errors(text, lineno, message):
+    with pytest.raises(ParseError, match=message) as error:
+        parse(text, strict=True)
+    assert lineno == error.value.lineno
+    assert '.env, line {}:'.format(lineno) in str(error.value)
@@ -0,0 +1,108 @@
+# coding: utf-8
+import os
+import sys
+from mock import patch
+import pytest
+from decouple import (Config, FrozenConfig, RepositoryEnv, RepositoryIni, RepositoryEmpty,
+                      AutoConfig, UndefinedValueError)
+
+# Useful for very coarse version differentiation.
+PY3 = sys.version_info[0] == 3
+
+if PY3:
+    from io import StringIO
+else:
+    from io import BytesIO as StringIO
+
+
+ENVFILE = '''
+KeyTrue=True
+KeyOverrideByEnv=NotThis
+'''
+
+INIFILE = '''
+[settings]
+KeyTrue=True
+Interpolation=%(KeyTrue)s
+'''
+
+
+@pytest.fixture
+def config():
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        return Config(RepositoryEnv('.env'))
+
+
+def test_frozen_get(config):
+    frozen = config.freeze()
+    assert isinstance(frozen, FrozenConfig)
+    assert True is frozen('KeyTrue', cast=bool)
+    assert 'default' == frozen('UndefinedKey', default='default')
+
+    with pytest.raises(UndefinedValueError):
+        frozen('UndefinedKey')
+
+
+def test_frozen_environ_beats_repository(config):
+    os.environ['KeyOverrideByEnv'] = 'This'
+    frozen = config.freeze()
+    del os.environ['KeyOverrideByEnv']
+
+    assert 'This' == frozen('KeyOverrideByEnv')
+    assert 'NotThis' == config('KeyOverrideByEnv')
+
+
+def test_frozen_ignores_later_changes(config):
+    frozen = config.freeze()
+    os.environ['KeyOnlyEnviron'] = 'Later'
+    with pytest.raises(UndefinedValueError):
+        frozen('KeyOnlyEnviron')
+    del os.environ['KeyOnlyEnviron']
+
+
+def test_frozen_drift(config):
+    os.environ['KeyRemoved'] = 'Removed'
+    os.environ['KeyChanged'] = 'Before'
+    frozen = config.freeze()
+    assert {} == frozen.drift()
+
+    del os.environ['KeyRemoved']
+    os.environ['KeyChanged'] = 'After'
+    os.environ['KeyAdded'] = 'Added'
+
+    assert {
+        'KeyRemoved': ('Removed', None),
+        'KeyChanged': ('Before', 'After'),
+        'KeyAdded': (None, 'Added'),
+    } == frozen.drift()
+
+    del os.environ['KeyChanged']
+    del os.environ['KeyAdded']
+
+
+def test_frozen_ini_is_case_insensitive():
+    with patch('decouple.open', return_value=StringIO(INIFILE), create=True):
+        frozen = Config(RepositoryIni('settings.ini')).freeze()
+
+    assert 'True' == frozen('KeyTrue')
+    assert 'True' == frozen('keytrue')
+    assert 'True' == frozen('Interpolation')
+
+
+def test_frozen_empty_repository():
+    os.environ['KeyOnlyEnviron'] = 'Environ'
+    frozen = Config(RepositoryEmpty()).freeze()
+    del os.environ['KeyOnlyEnviron']
+
+    assert 'Environ' == frozen('KeyOnlyEnviron')
+
+
+def test_frozen_requires_keys():
+    with pytest.raises(TypeError):
+        Config(object()).freeze()
+
+
+def test_autoconfig_freeze():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    frozen = AutoConfig(path).freeze()
+    assert 'INI' == frozen('KEY')
@@ -0,0 +1,84 @@
+# coding: utf-8
+import os
+import pytest
+from mock import patch
+from decouple import (Config, RepositoryEnv, RepositoryIni, RepositorySecret, AutoConfig,
+                      ConfigurationError, UndefinedValueError, Csv, undefined)
+
+
+@pytest.fixture
+def envfile(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('DEBUG=on\nPORT=8000\nHOSTS=a, b\nNAME=app\n')
+    return str(envfile)
+
+
+@pytest.fixture
+def config(envfile):
+    return Config(RepositoryEnv(envfile))
+
+
+SPEC = {
+    'DEBUG': (False, bool),
+    'PORT': (undefined, int),
+    'HOSTS': ([], Csv()),
+    'TIMEOUT': (30, int),
+    'NAME': (undefined, undefined),
+}
+
+EXPECTED = {'DEBUG': True, 'PORT': 8000, 'HOSTS': ['a', 'b'], 'TIMEOUT': 30, 'NAME': 'app'}
+
+
+def test_get_many(config):
+    assert EXPECTED == config.get_many(SPEC)
+
+
+def test_get_many_environ_first(config):
+    with patch.dict(os.environ, {'PORT': '9000'}):
+        assert 9000 == config.get_many(SPEC)['PORT']
+
+
+def test_get_many_errors(config):
+    spec = dict(SPEC, NAME=(undefined, int), MISSING=(undefined, str))
+    with pytest.raises(ConfigurationError) as error:
+        config.get_many(spec)
+    assert {'NAME', 'MISSING'} == set(error.value.errors)
+    assert isinstance(error.value.errors['NAME'], ValueError)
+    assert isinstance(error.value.errors['MISSING'], UndefinedValueError)
+
+
+@pytest.mark.parametrize('make', [
+    lambda config: config.freeze(),
+    lambda config: Config(config.repository, cache=True),
+])
+def test_get_many_other_configs(config, make):
+    assert EXPECTED == make(config).get_many(SPEC)
+
+
+def test_get_many_with_hooks(config):
+    recorder = config.record()
+    config.get_many(SPEC)
+    assert 1 == recorder.as_dict()['PORT']['count']
+
+
+def test_get_many_ini(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nDEBUG=on\nPORT=8000\n')
+    config = Config(RepositoryIni(str(inifile)))
+    assert {'debug': True, 'PORT': 8000} == config.get_many({'debug': (False, bool), 'PORT': (0, int)})
+
+
+def test_get_many_secrets(tmpdir):
+    tmpdir.join('PORT').write('8000')
+    config = Config(RepositorySecret(str(tmpdir), lazy=True))
+    assert {'PORT': 8000, 'NAME': 'x'} == config.get_many({'PORT': (0, int), 'NAME': ('x', str)})
+
+
+def test_get_many_any_repository():
+    config = Config({'PORT': '8000'})
+    assert {'PORT': 8000, 'NAME': 'x'} == config.get_many({'PORT': (0, int), 'NAME': ('x', str)})
+
+
+def test_autoconfig_get_many(tmpdir):
+    tmpdir.join('.env').write('PORT=8000\n')
+    assert {'PORT': 8000} == AutoConfig(str(tmpdir)).get_many({'PORT': (undefined, int)})
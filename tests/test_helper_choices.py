@@ -101,3 +101,35 @@ def test_cast_to_int_with_booth_flat_list_and_django_like_choices():
 
     with pytest.raises(ValueError):
         choices('1')
+
+
+def test_normalize():
+    """Normalized values match the choice they normalize to."""
+    choices = Choices(['US', 'BR', 'PT'], normalize=lambda s: s.lower())
+    assert 'US' == choices('us')
+    assert 'BR' == choices('Br')
+    assert 'PT' == choices('PT')
+
+    with pytest.raises(ValueError):
+        choices('uk')
+
+
+def test_unhashable_choices():
+    """Unhashable choices are still matched."""
+    choices = Choices([['a', 'b'], 'c'], cast=lambda s: s.split(',') if ',' in s else s)
+    assert ['a', 'b'] == choices('a,b')
+    assert 'c' == choices('c')
+
+    with pytest.raises(ValueError):
+        choices('a,c')
+
+
+def test_error_message():
+    """The error lists the valid values."""
+    choices = Choices(['eth', 'usb'], choices=ALLOWED_FRUITS)
+
+    with pytest.raises(ValueError) as excinfo:
+        choices('serial')
+
+    assert ("Value not in list: 'serial'; valid values are "
+            "['eth', 'usb', 'apple', 'banana', 'coconut']") == str(excinfo.value)
@@ -1,4 +1,5 @@
 # coding: utf-8
+from mock import patch
 from decouple import Csv
 
 
@@ -34,3 +35,26 @@ def test_csv_quoted_parse():
 def test_csv_none():
     csv = Csv()
     assert [] == csv(None)
+
+
+def test_csv_plain_matches_shlex():
+    csv = Csv()
+    assert ['a', 'b'] == csv('a,,b')
+    assert ['a', '', 'b'] == csv('a, ,b')
+    assert ['a'] == csv(',a,')
+    assert [] == csv('')
+
+    csv = Csv(delimiter=', ')
+    assert ['a', 'b', 'c'] == csv('a b,c')
+
+
+def test_csv_comment_uses_shlex():
+    csv = Csv()
+    assert ['a'] == csv('a#b, c')
+
+
+def test_csv_plain_does_not_use_shlex():
+    csv = Csv()
+    with patch('shlex.shlex') as shlex:
+        assert ['a', 'b'] == csv('a, b')
+        assert not shlex.called
@@ -0,0 +1,113 @@
+# coding: utf-8
+import os
+import sys
+from mock import patch, Mock
+import pytest
+from decouple import Config, RepositoryEnv, AutoConfig, Recorder, Schema, Setting, UndefinedValueError
+
+# Useful for very coarse version differentiation.
+PY3 = sys.version_info[0] == 3
+
+if PY3:
+    from io import StringIO
+else:
+    from io import BytesIO as StringIO
+
+
+ENVFILE = '''
+DEBUG=True
+'''
+
+
+@pytest.fixture
+def config():
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        return Config(RepositoryEnv('.env'))
+
+
+def test_hook_called_with_source(config):
+    hook = Mock()
+    config.add_hook(hook)
+
+    os.environ['KeyOnlyEnviron'] = 'Environ'
+    config('KeyOnlyEnviron')
+    del os.environ['KeyOnlyEnviron']
+    config('DEBUG', cast=bool)
+    config('UndefinedKey', default=None)
+
+    assert [('KeyOnlyEnviron', 'environ'), ('DEBUG', 'repository'), ('UndefinedKey', 'default')] == \
+        [call[0][:2] for call in hook.call_args_list]
+
+    config.remove_hook(hook)
+    config('DEBUG')
+    assert 3 == hook.call_count
+
+
+def test_hook_not_called_for_undefined(config):
+    hook = Mock()
+    config.add_hook(hook)
+
+    with pytest.raises(UndefinedValueError):
+        config('UndefinedKey')
+    assert not hook.called
+
+
+def test_recorder(config):
+    recorder = config.record()
+    assert isinstance(recorder, Recorder)
+
+    config('DEBUG', cast=bool)
+    config('DEBUG')
+    config('UndefinedKey', default='')
+
+    stats = recorder.as_dict()
+    assert 2 == stats['DEBUG']['count']
+    assert {'repository': 2} == stats['DEBUG']['sources']
+    assert stats['DEBUG']['cast_time'] >= 0
+    assert {'default': 1} == stats['UndefinedKey']['sources']
+
+    recorder.clear()
+    assert {} == recorder.as_dict()
+
+
+def test_recorder_cache_hits():
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        config = Config(RepositoryEnv('.env'), cache=True)
+    recorder = config.record()
+
+    config('DEBUG')
+    config('DEBUG')
+
+    assert {'repository': 1, 'cache': 1} == recorder.as_dict()['DEBUG']['sources']
+
+
+def test_recorder_frozen(config):
+    frozen = config.freeze()
+    recorder = frozen.record()
+
+    os.environ['DEBUG'] = 'False'
+    assert 'True' == frozen('DEBUG')
+    del os.environ['DEBUG']
+
+    assert {'repository': 1} == recorder.as_dict()['DEBUG']['sources']
+
+
+def test_autoconfig_record():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'ini', 'project')
+    config = AutoConfig(path)
+    recorder = config.record()
+
+    config('KEY')
+    assert {'repository': 1} == recorder.as_dict()['KEY']['sources']
+
+
+def test_hooks_follow_freeze(config):
+    recorder = config.record()
+    config.freeze()('DEBUG')
+    assert {'repository': 1} == recorder.as_dict()['DEBUG']['sources']
+
+
+def test_hooks_see_schema_lookups(config):
+    recorder = config.record()
+    Schema(DEBUG=Setting(cast=bool)).resolve(config)
+    assert {'repository': 1} == recorder.as_dict()['DEBUG']['sources']
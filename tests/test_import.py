@@ -0,0 +1,36 @@
+# coding: utf-8
+import os
+import subprocess
+import sys
+import pytest
+import decouple
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='needs module __getattr__')
+def test_import_defers_heavy_modules():
+    script = (
+        'import sys, decouple; '
+        'print(" ".join(m for m in ("configparser", "shlex", "string", "re") if m in sys.modules))'
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.check_output([sys.executable, '-S', '-c', script], env=env)
+    assert b'' == output.strip()
+
+
+@pytest.mark.parametrize('name', ['ConfigParser', 'InterpolationError', 'NoOptionError', 'shlex',
+                                  'string', 'partial', 'OrderedDict'])
+def test_lazy_names_are_still_exported(name):
+    assert getattr(decouple, name) is not None
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        decouple.DoesNotExist
+
+
+def test_setup_reads_module_version():
+    output = subprocess.check_output([sys.executable, 'setup.py', '--version'], cwd=ROOT)
+    assert decouple.__version__ == output.decode('utf-8').split()[-1]
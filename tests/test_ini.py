@@ -3,7 +3,7 @@ import os
 import sys
 from mock import patch, mock_open
 import pytest
-from decouple import Config, RepositoryIni, UndefinedValueError
+from decouple import Config, RepositoryIni, UndefinedValueError, InterpolationError
 
 # Useful for very coarse version differentiation.
 PY3 = sys.version_info[0] == 3
@@ -126,3 +126,89 @@ def test_ini_empty_string_means_false(config):
 def test_ini_repo_keyerror(config):
     with pytest.raises(KeyError):
         config.repository['UndefinedKey']
+
+
+def test_ini_reload_on_change(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nKEY=old\n')
+    config = Config(RepositoryIni(str(inifile), reload_interval=0))
+    assert 'old' == config('KEY')
+
+    inifile.write('[settings]\nKEY=newer\n')
+    assert 'newer' == config('KEY')
+
+
+def test_ini_reload_keeps_values_of_malformed_file(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nDB_HOST=localhost\n')
+    repository = RepositoryIni(str(inifile), reload_interval=0)
+    config = Config(repository)
+
+    inifile.write('DB_HOST=no section header\n')
+    with pytest.warns(RuntimeWarning):
+        assert 'localhost' == config('DB_HOST')
+    assert 'MissingSectionHeaderError' == type(repository.last_error).__name__
+    assert 0 == repository.version
+
+    inifile.write('[settings]\nDB_HOST=fixed\n')
+    assert 'fixed' == config('DB_HOST')
+    assert None is repository.last_error
+
+
+def test_ini_reload_swaps_data_and_errors_together(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nKEY=%(missing)s\n')
+    repository = RepositoryIni(str(inifile), reload_interval=0)
+    snapshot = repository._snapshot
+
+    inifile.write('[settings]\nKEY=value\nOTHER=%(missing)s\n')
+    assert 'value' == repository['KEY']
+
+    # Readers holding the previous version keep a consistent one.
+    assert ({}, ['key']) == (snapshot[1], list(snapshot[2]))
+    assert ['other'] == list(repository.errors)
+
+
+SECTIONSFILE = '''
+[DEFAULT]
+Shared=default
+
+[settings]
+KeyOverride=settings
+KeyOnlySettings=settings
+Broken=%(Missing)s
+
+[production]
+KeyOverride=production
+Interpolation=%(KeyOverride)s
+'''
+
+
+def test_ini_materialized(config):
+    assert 'off' == config.repository.data['interpolation']
+    assert 'KeyTrue' in config.repository
+    assert 'keytrue' in config.repository.keys()
+
+
+def test_ini_sections():
+    with patch('decouple.open', return_value=StringIO(SECTIONSFILE), create=True):
+        config = Config(RepositoryIni('settings.ini', sections=['production', 'missing']))
+
+    assert 'production' == config('KeyOverride')
+    assert 'settings' == config('KeyOnlySettings')
+    assert 'production' == config('Interpolation')
+    assert 'default' == config('Shared')
+
+
+def test_ini_interpolation_error_on_lookup():
+    with patch('decouple.open', return_value=StringIO(SECTIONSFILE), create=True):
+        config = Config(RepositoryIni('settings.ini'))
+
+    assert 'Broken' in config.repository
+    with pytest.raises(InterpolationError):
+        config('Broken')
+
+    frozen = config.freeze()
+    assert 'settings' == frozen('KeyOverride')
+    with pytest.raises(InterpolationError):
+        frozen('Broken')
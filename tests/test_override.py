@@ -0,0 +1,164 @@
+# coding: utf-8
+import os
+import sys
+import threading
+import pytest
+from mock import patch
+from decouple import (Config, AutoConfig, AsyncConfig, RepositoryEnv, Schema, Setting,
+                      UndefinedValueError)
+
+
+@pytest.fixture
+def config(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('DEBUG=False\nDB_HOST=localhost\nDB_PORT=5432\n')
+    return Config(RepositoryEnv(str(envfile)))
+
+
+def test_override(config):
+    with config.override(DEBUG='True'):
+        assert True is config('DEBUG', cast=bool)
+    assert False is config('DEBUG', cast=bool)
+
+
+def test_override_undefined_option(config):
+    with config.override(TIMEOUT='30'):
+        assert 30 == config('TIMEOUT', cast=int)
+    with pytest.raises(UndefinedValueError):
+        config('TIMEOUT')
+
+
+def test_override_leaves_environ_untouched(config):
+    with config.override(DEBUG='True'):
+        assert 'DEBUG' not in os.environ
+
+
+def test_override_beats_environ(config):
+    with patch.dict(os.environ, {'DEBUG': 'False'}):
+        with config.override(DEBUG='True'):
+            assert 'True' == config('DEBUG')
+
+
+def test_override_beats_cache(config):
+    config = Config(config.repository, cache=True)
+    assert 'False' == config('DEBUG')
+    with config.override(DEBUG='True'):
+        assert 'True' == config('DEBUG')
+    assert 'False' == config('DEBUG')
+    assert 1 == config.cache_hits
+
+
+def test_override_nested(config):
+    with config.override(DEBUG='True', DB_PORT='1'):
+        with config.override(DB_PORT='2'):
+            assert 'True' == config('DEBUG')
+            assert '2' == config('DB_PORT')
+        assert '1' == config('DB_PORT')
+    assert '5432' == config('DB_PORT')
+
+
+def test_override_unwinds_on_error(config):
+    with pytest.raises(RuntimeError):
+        with config.override(DEBUG='True'):
+            raise RuntimeError()
+    assert 'False' == config('DEBUG')
+
+
+def test_override_per_config(config):
+    other = Config(config.repository)
+    with config.override(DEBUG='True'):
+        assert 'False' == other('DEBUG')
+
+
+def test_override_per_thread(config):
+    seen = []
+    with config.override(DEBUG='True'):
+        thread = threading.Thread(target=lambda: seen.append(config('DEBUG')))
+        thread.start()
+        thread.join()
+    assert ['False'] == seen
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='needs contextvars')
+def test_override_per_task(config):
+    import asyncio
+
+    async def read(value):
+        with config.override(DEBUG=value):
+            await asyncio.sleep(0)
+            return config('DEBUG')
+
+    async def main():
+        return await asyncio.gather(read('1'), read('2'))
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert ['1', '2'] == loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='needs contextvars')
+def test_override_reaches_async_config(config):
+    import asyncio
+
+    async def main():
+        with config.override(DEBUG='True'):
+            return await AsyncConfig(config).aget('DEBUG')
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert 'True' == loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def test_override_get_many(config):
+    with config.override(DB_PORT='1'):
+        assert {'DB_PORT': 1, 'DEBUG': False} == config.get_many({
+            'DB_PORT': (0, int),
+            'DEBUG': (True, bool),
+        })
+
+
+def test_override_get_prefixed(config):
+    with config.override(DB_PORT='1', DB_USER='admin'):
+        assert {'HOST': 'localhost', 'PORT': '1', 'USER': 'admin'} == config.get_prefixed('DB_')
+
+
+def test_override_hook_source(config):
+    recorder = config.record()
+    with config.override(DEBUG='True'):
+        config('DEBUG', cast=bool)
+    assert {'override': 1} == recorder.as_dict()['DEBUG']['sources']
+
+
+def test_override_frozen(config):
+    frozen = config.freeze()
+    with frozen.override(DEBUG='True'):
+        assert 'True' == frozen('DEBUG')
+    assert 'False' == frozen('DEBUG')
+
+
+def test_override_applies_to_freeze(config):
+    frozen = config.freeze()
+    with config.override(DEBUG='True'):
+        assert True is frozen('DEBUG', cast=bool)
+        assert True is config.freeze()('DEBUG', cast=bool)
+
+
+def test_override_applies_to_schema(config):
+    schema = Schema(DEBUG=Setting(cast=bool))
+    with config.override(DEBUG='True'):
+        assert True is config('DEBUG', cast=bool)
+        assert True is schema.resolve(config).DEBUG
+        assert True is schema.resolve(config.freeze()).DEBUG
+
+
+def test_override_autoconfig():
+    path = os.path.join(os.path.dirname(__file__), 'autoconfig', 'env', 'custom-path')
+    config = AutoConfig(path)
+
+    with config.override(KEY='overridden'):
+        assert 'overridden' == config('KEY')
+    assert 'overridden' != config('KEY')
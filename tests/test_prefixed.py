@@ -0,0 +1,82 @@
+# coding: utf-8
+import os
+import pytest
+from mock import patch
+from decouple import Config, RepositoryEnv, RepositoryIni, RepositoryEmpty, AutoConfig
+
+
+@pytest.fixture
+def config(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('DB_HOST=localhost\nDB_PORT=5432\nDB_NAME=app\nDBX=not db\nCACHE_URL=redis://\n')
+    return Config(RepositoryEnv(str(envfile)))
+
+
+def test_get_prefixed(config):
+    assert {'HOST': 'localhost', 'PORT': '5432', 'NAME': 'app'} == config.get_prefixed('DB_')
+
+
+def test_get_prefixed_keeps_prefix(config):
+    assert {'CACHE_URL': 'redis://'} == config.get_prefixed('CACHE_', strip_prefix=False)
+
+
+def test_get_prefixed_environ_first(config):
+    with patch.dict(os.environ, {'DB_PORT': '6543', 'DB_USER': 'admin'}):
+        values = config.get_prefixed('DB_')
+    assert '6543' == values['PORT']
+    assert 'admin' == values['USER']
+
+
+def test_get_prefixed_cast(config):
+    with patch.dict(os.environ, {'PORT_A': '1', 'PORT_B': '2'}):
+        assert {'A': 1, 'B': 2} == Config(RepositoryEmpty()).get_prefixed('PORT_', cast=int)
+
+
+def test_get_prefixed_no_match(config):
+    assert {} == config.get_prefixed('NOPE_')
+
+
+def test_get_prefixed_sees_reloads(tmpdir):
+    envfile = tmpdir.join('.env')
+    envfile.write('DB_HOST=localhost\n')
+    repository = RepositoryEnv(str(envfile))
+    config = Config(repository)
+    assert ['HOST'] == list(config.get_prefixed('DB_'))
+
+    envfile.write('DB_HOST=localhost\nDB_PORT=5432\n')
+    repository.reload()
+    assert {'HOST', 'PORT'} == set(config.get_prefixed('DB_'))
+
+
+def test_get_prefixed_ini_is_case_insensitive(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nDB_HOST=localhost\nOTHER=1\n')
+    config = Config(RepositoryIni(str(inifile)))
+    assert {'host': 'localhost'} == config.get_prefixed('DB_')
+
+
+def test_get_prefixed_environ_hides_ini_option(tmpdir):
+    inifile = tmpdir.join('settings.ini')
+    inifile.write('[settings]\nDB_HOST=ini\nDB_PORT=5432\n')
+    config = Config(RepositoryIni(str(inifile)))
+
+    with patch.dict(os.environ, {'DB_HOST': 'environ'}):
+        assert 'environ' == config.get('DB_HOST')
+        assert {'HOST': 'environ', 'port': '5432'} == config.get_prefixed('DB_')
+        assert {'HOST': 'environ', 'port': '5432'} == config.freeze().get_prefixed('DB_')
+
+        with config.override(DB_PORT='1'):
+            assert {'HOST': 'environ', 'PORT': '1'} == config.get_prefixed('DB_')
+
+
+def test_get_prefixed_frozen(config):
+    with patch.dict(os.environ, {'DB_USER': 'admin'}):
+        frozen = config.freeze()
+    with patch.dict(os.environ, {'DB_OTHER': 'later'}):
+        values = frozen.get_prefixed('DB_')
+    assert {'HOST': 'localhost', 'PORT': '5432', 'NAME': 'app', 'USER': 'admin'} == values
+
+
+def test_autoconfig_get_prefixed(tmpdir):
+    tmpdir.join('.env').write('DB_HOST=localhost\n')
+    assert {'HOST': 'localhost'} == AutoConfig(str(tmpdir)).get_prefixed('DB_')
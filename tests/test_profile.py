@@ -0,0 +1,119 @@
+# coding: utf-8
+import json
+import os
+import subprocess
+import sys
+import pytest
+from mock import patch
+import decouple
+from decouple import profile, undefined, Csv
+
+if sys.version_info[0] == 3:
+    from io import StringIO
+else:
+    from io import BytesIO as StringIO
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def project(tmpdir):
+    tmpdir.join('.env').write('DEBUG=True\nPORT=80\nHOSTS=a,b\n')
+    return tmpdir.mkdir('app').mkdir('views')
+
+
+def run(*argv):
+    stream = StringIO()
+    decouple._main(list(argv), stream=stream)
+    return stream.getvalue()
+
+
+def test_profile(project):
+    report = profile(str(project))
+
+    root = os.path.dirname(os.path.dirname(str(project)))
+    assert [str(project), os.path.dirname(str(project)), root] == report['visited']
+    assert os.path.join(root, '.env') == report['file']
+    assert 'RepositoryEnv' == report['repository']
+    assert 3 == report['options']
+    assert report['parse_time'] > 0
+
+
+def test_profile_no_file(tmpdir):
+    with patch.object(decouple.AutoConfig, '_scan', return_value=''):
+        report = profile(str(tmpdir))
+
+    assert report['file'] is None
+    assert 'RepositoryEmpty' == report['repository']
+
+
+def test_profile_lookups(project):
+    with patch.dict(os.environ, {'PORT': '8000'}):
+        report = profile(str(project), [
+            ('DEBUG', undefined, bool),
+            ('PORT', undefined, int),
+            ('HOSTS', undefined, Csv()),
+            ('TIMEOUT', 30, int),
+            ('MISSING', undefined, undefined),
+        ])
+
+    lookups = report['lookups']
+    assert ['DEBUG', 'PORT', 'HOSTS', 'TIMEOUT', 'MISSING'] == list(lookups)
+    assert 'repository' == lookups['DEBUG']['source']
+    assert 'environ' == lookups['PORT']['source']
+    assert 'default' == lookups['TIMEOUT']['source']
+    assert lookups['HOSTS']['cast_time'] >= 0
+    assert lookups['MISSING']['error'].startswith('UndefinedValueError')
+
+
+def test_main_text(project):
+    output = run('profile', '--path', str(project), 'DEBUG:bool', 'MISSING')
+
+    assert 'Repository: RepositoryEnv' in output
+    assert '  ' + str(project) + '\n' in output
+    assert 'DEBUG    repository' in output
+    assert 'MISSING  UndefinedValueError' in output
+    # Values are never shown.
+    assert 'True' not in output
+
+
+def test_main_json(project):
+    report = json.loads(run('profile', '--path', str(project), '--json', 'PORT:int'))
+
+    assert 'RepositoryEnv' == report['repository']
+    assert 'repository' == report['lookups']['PORT']['source']
+
+
+def test_main_schema(project, tmpdir, monkeypatch):
+    tmpdir.join('myschema.py').write(
+        'from decouple import Schema, Setting\n'
+        'schema = Schema(DEBUG=Setting(cast=bool), WORKERS=Setting(default=4, option="WEB_WORKERS"))\n')
+    monkeypatch.syspath_prepend(str(tmpdir))
+
+    report = json.loads(run('profile', '--path', str(project), '--json', '--schema', 'myschema:schema'))
+
+    assert {'DEBUG': 'repository', 'WEB_WORKERS': 'default'} == dict(
+        (option, result['source']) for option, result in report['lookups'].items())
+
+
+@pytest.mark.parametrize('argv', [
+    ['profile', 'DEBUG:date'],
+    ['profile', '--schema', 'no_colon'],
+    ['profile', '--schema', 'decouple:DoesNotExist'],
+    [],
+])
+def test_main_errors(argv):
+    with patch('sys.stderr'):
+        with pytest.raises(SystemExit):
+            run(*argv)
+
+
+def test_module_entry_point(project):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.check_output(
+        [sys.executable, '-m', 'decouple', 'profile', '--json', 'DEBUG:bool'], cwd=str(project), env=env)
+
+    report = json.loads(output.decode('utf-8'))
+    assert 'RepositoryEnv' == report['repository']
+    assert 'repository' == report['lookups']['DEBUG']['source']
@@ -0,0 +1,104 @@
+# coding: utf-8
+import os
+import sys
+from mock import patch
+import pytest
+from decouple import (Config, RepositoryEnv, RepositorySecret, Schema, Setting, Settings, ConfigurationError,
+                      UndefinedValueError, Csv, Choices)
+
+# Useful for very coarse version differentiation.
+PY3 = sys.version_info[0] == 3
+
+if PY3:
+    from io import StringIO
+else:
+    from io import BytesIO as StringIO
+
+
+ENVFILE = '''
+DEBUG=True
+ALLOWED_HOSTS=.localhost, .herokuapp.com
+CONNECTION_TYPE=usb
+PORT=not-a-number
+'''
+
+
+@pytest.fixture(scope='module')
+def config():
+    with patch('decouple.open', return_value=StringIO(ENVFILE), create=True):
+        return Config(RepositoryEnv('.env'))
+
+
+def test_schema_resolve(config):
+    schema = Schema(
+        DEBUG=Setting(default=False, cast=bool),
+        ALLOWED_HOSTS=Setting(cast=Csv()),
+        CONNECTION=Setting(cast=Choices(['eth', 'usb']), option='CONNECTION_TYPE'),
+        EMAIL_PORT=Setting(default=25, cast=int),
+    )
+    settings = schema.resolve(config)
+
+    assert isinstance(settings, Settings)
+    assert True is settings.DEBUG
+    assert ['.localhost', '.herokuapp.com'] == settings.ALLOWED_HOSTS
+    assert 'usb' == settings.CONNECTION
+    assert 25 == settings.EMAIL_PORT
+
+
+def test_schema_settings_are_immutable(config):
+    settings = Schema(DEBUG=Setting(cast=bool))(config)
+
+    with pytest.raises(AttributeError):
+        settings.DEBUG = False
+    with pytest.raises(AttributeError):
+        del settings.DEBUG
+    with pytest.raises(AttributeError):
+        settings.OTHER = True
+
+    assert {'DEBUG': True} == settings.as_dict()
+
+
+def test_schema_reports_all_errors(config):
+    schema = Schema([
+        ('SECRET_KEY', Setting()),
+        ('PORT', Setting(cast=int)),
+        ('CONNECTION_TYPE', Setting(cast=Choices(['eth']))),
+        ('DEBUG', Setting(cast=bool)),
+    ])
+
+    with pytest.raises(ConfigurationError) as excinfo:
+        schema.resolve(config)
+
+    errors = excinfo.value.errors
+    assert ['CONNECTION_TYPE', 'PORT', 'SECRET_KEY'] == sorted(errors)
+    assert isinstance(errors['SECRET_KEY'], UndefinedValueError)
+    assert isinstance(errors['PORT'], ValueError)
+    assert 'SECRET_KEY' in str(excinfo.value)
+
+
+def test_schema_environ_beats_repository(config):
+    os.environ['DEBUG'] = 'False'
+    assert False is Schema(DEBUG=Setting(cast=bool)).resolve(config).DEBUG
+    del os.environ['DEBUG']
+
+
+class RepositoryWithoutKeys(object):
+    def __contains__(self, key):
+        return key == 'DEBUG'
+
+    def __getitem__(self, key):
+        return 'True'
+
+
+def test_schema_repository_without_keys():
+    config = Config(RepositoryWithoutKeys())
+    assert True is Schema(DEBUG=Setting(cast=bool)).resolve(config).DEBUG
+
+
+def test_schema_reads_only_its_options(tmpdir):
+    tmpdir.join('db_user').write('hello')
+    tmpdir.join('bundle').write('x' * 1024)
+    config = Config(RepositorySecret(str(tmpdir), lazy=True))
+
+    assert 'hello' == Schema(db_user=Setting()).resolve(config).db_user
+    assert ['db_user'] == list(config.repository.data)
@@ -1,6 +1,7 @@
 # coding: utf-8
 import os
 import pytest
+from mock import patch
 
 from decouple import Config, RepositorySecret
 
@@ -36,3 +37,115 @@ def test_secret_repo_keyerror():
 
     with pytest.raises(KeyError):
         repo['UndefinedKey']
+
+
+def test_secret_lazy():
+    path = os.path.join(os.path.dirname(__file__), 'secrets')
+    repo = RepositorySecret(path, lazy=True)
+
+    assert {} == repo.data
+    assert 'db_user' in repo
+    assert 'hello' == repo['db_user']
+    assert {'db_user': 'hello'} == repo.data
+
+    with pytest.raises(KeyError):
+        repo['UndefinedKey']
+
+
+def test_secret_binary():
+    path = os.path.join(os.path.dirname(__file__), 'secrets')
+    repo = RepositorySecret(path, binary=True)
+
+    assert b'hello' == repo['db_user']
+
+
+def test_secret_max_size():
+    path = os.path.join(os.path.dirname(__file__), 'secrets')
+
+    with pytest.raises(ValueError):
+        RepositorySecret(path, max_size=4)
+
+    repo = RepositorySecret(path, lazy=True, max_size=4)
+    with pytest.raises(ValueError):
+        repo['db_user']
+
+
+def write_version(path, version, secrets):
+    """
+    Lay secrets out like Kubernetes: files in a versioned directory, the
+    ..data symlink to it and one symlink per secret through ..data.
+    """
+    directory = path.join('..' + version)
+    directory.mkdir()
+    for name, value in secrets.items():
+        directory.join(name).write(value)
+
+    # Swapped atomically with a rename, as the kubelet does.
+    temp = str(path.join('..data_tmp'))
+    os.symlink('..' + version, temp)
+    os.rename(temp, str(path.join('..data')))
+
+    for name in secrets:
+        if not path.join(name).check(link=1):
+            os.symlink(os.path.join('..data', name), str(path.join(name)))
+
+
+def test_secret_kubernetes_layout(tmpdir):
+    write_version(tmpdir, 'v1', {'db_user': 'hello', 'db_password': 'world'})
+    repo = RepositorySecret(str(tmpdir))
+
+    assert {'db_user', 'db_password'} == set(repo.keys())
+    assert 'hello' == repo['db_user']
+
+
+def test_secret_rotation(tmpdir):
+    write_version(tmpdir, 'v1', {'db_user': 'hello', 'db_password': 'world'})
+    config = Config(RepositorySecret(str(tmpdir), reload_interval=0))
+    assert 'world' == config('db_password')
+
+    write_version(tmpdir, 'v2', {'db_user': 'hello', 'db_password': 'rotated'})
+    assert 'rotated' == config('db_password')
+    assert 1 == config.repository.version
+
+
+def test_secret_rotation_checks_once_per_interval(tmpdir):
+    write_version(tmpdir, 'v1', {'db_password': 'world'})
+    repo = RepositorySecret(str(tmpdir), reload_interval=60)
+    write_version(tmpdir, 'v2', {'db_password': 'rotated'})
+
+    with patch('os.stat') as stat:
+        assert 'world' == repo['db_password']
+        assert not stat.called
+
+
+def test_secret_rotation_reads_changed_files_only(tmpdir):
+    tmpdir.join('db_user').write('hello')
+    tmpdir.join('db_password').write('world')
+    repo = RepositorySecret(str(tmpdir), reload_interval=0)
+
+    tmpdir.join('new').write('rotated')
+    tmpdir.join('new').rename(tmpdir.join('db_password'))
+    # Don't depend on the resolution of the file system timestamps.
+    os.utime(str(tmpdir), (0, 0))
+
+    with patch.object(RepositorySecret, '_read', return_value='rotated') as read:
+        assert 'rotated' == repo['db_password']
+        assert 'hello' == repo['db_user']
+    read.assert_called_once_with('db_password')
+
+
+def test_secret_rotation_keeps_old_values_on_failure(tmpdir):
+    write_version(tmpdir, 'v1', {'db_user': 'hello', 'db_password': 'world'})
+    repo = RepositorySecret(str(tmpdir), reload_interval=0)
+    write_version(tmpdir, 'v2', {'db_user': 'hi', 'db_password': 'rotated'})
+
+    def read(name):
+        if name == 'db_password':
+            raise OSError()
+        return 'hi'
+
+    # A file vanishes in the middle of the reload: nothing changes.
+    with patch.object(RepositorySecret, '_read', side_effect=read):
+        assert ('hello', 'world') == (repo['db_user'], repo['db_password'])
+
+    assert ('hi', 'rotated') == (repo['db_user'], repo['db_password'])